@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from web.sinta_app import SintaScrapingApp
 from web.utils import Utils
+from web.config import config
 
 
 def create_argument_parser():
@@ -49,7 +50,22 @@ Examples:
     
     # Additional options
     parser.add_argument('--force-login', action='store_true', help='Force new login (ignore saved session)')
+    parser.add_argument('--since', type=int, metavar='YEAR', help='Only keep items from this year onwards')
+    parser.add_argument('--until', type=int, metavar='YEAR', help='Only keep items up to and including this year')
+    parser.add_argument('--no-skip-empty', action='store_true', help='Request every view even when the profile page counts it as empty')
+    parser.add_argument('--incremental', action='store_true', help='Stop paging each view at items already known from the last run and merge them back in')
+    parser.add_argument('--resume', action='store_true', help='Resume an interrupted run, skipping pages already in the job journal')
     parser.add_argument('--config', default='dosen.txt', help='Path to lecturer configuration file (default: dosen.txt)')
+    parser.add_argument('--workers', type=int, help='Number of concurrent fetch workers (default: 4)')
+    parser.add_argument('--page-workers', type=int, help='Number of pages fetched in parallel per view (default: 4)')
+    parser.add_argument('--parse-processes', type=int, help='Parse pages on this many worker processes (default: 0, parse in-process)')
+    parser.add_argument('--request-delay', type=float, help='Average seconds between requests across all workers (default: 1)')
+    parser.add_argument('--parser', choices=['auto', 'lxml', 'html.parser'], help='HTML parser backend (default: auto, lxml when installed)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the on-disk response cache')
+    parser.add_argument('--cache-only', action='store_true', help='Serve pages only from the response cache (no network requests)')
+    parser.add_argument('--cache-ttl', type=int, help='Seconds a cached page stays fresh (default: 86400)')
+    parser.add_argument('--record-fixtures', metavar='DIR', help='Also save every fetched profile page to DIR as a parser benchmark fixture')
+    parser.add_argument('--profile', action='store_true', help='Save a CPU profile and tracemalloc snapshot of the login, fetch, parse and write stages to the output directory')
     
     return parser
 
@@ -58,6 +74,40 @@ def run_cli():
     """Run CLI interface"""
     parser = create_argument_parser()
     args = parser.parse_args()
+    if args.since is not None and args.until is not None and args.since > args.until:
+        parser.error(f"--since {args.since} is later than --until {args.until}")
+    
+    # Apply concurrency override before the session is created
+    if args.workers:
+        config.set('scraping.max_workers', args.workers)
+    if args.page_workers:
+        config.set('scraping.page_workers', args.page_workers)
+    if args.parse_processes is not None:
+        config.set('scraping.parse_processes', args.parse_processes)
+    if args.request_delay is not None:
+        config.set('scraping.request_delay', args.request_delay)
+    if args.resume:
+        config.set('journal.resume', True)
+    if args.incremental:
+        config.set('incremental.enabled', True)
+    if args.no_skip_empty:
+        config.set('planning.enabled', False)
+    if args.record_fixtures:
+        config.set('fixtures.record_dir', args.record_fixtures)
+    if args.profile:
+        config.set('profiling.enabled', True)
+    if args.since is not None:
+        config.set('scraping.since', args.since)
+    if args.until is not None:
+        config.set('scraping.until', args.until)
+    if args.parser:
+        config.set('scraping.parser', args.parser)
+    if args.no_cache:
+        config.set('cache.enabled', False)
+    if args.cache_only:
+        config.set('cache.offline', True)
+    if args.cache_ttl is not None:
+        config.set('cache.ttl', args.cache_ttl)
     
     # Create the application instance
     app = SintaScrapingApp()
@@ -72,7 +122,7 @@ def run_cli():
         sys.exit(1)
     
     # Force new login if requested
-    if args.force_login:
+    if args.force_login and not args.cache_only:
         app.session_manager.initialize_session(force_new_login=True)
     
     # Determine what to scrape based on arguments
@@ -114,6 +164,8 @@ def run_cli():
         app.scrape_profil()
         scrape_something = True
     
+    app.close()
+    
     # If no specific category was specified, launch web interface
     if not scrape_something:
         launch_web_interface()
@@ -8,6 +8,8 @@ Modular SINTA scraping application with web interface support.
 from .config import config, ConfigManager
 from .utils import Utils
 from .session import SessionManager, LecturerManager, SintaRequestLogin
+from .fetcher import FetchEngine
+from .authors import AuthorDirectory
 from .sinta_app import SintaScrapingApp
 
 # Import all scrapers
@@ -32,6 +34,8 @@ __all__ = [
     'SessionManager',
     'LecturerManager', 
     'SintaRequestLogin',
+    'FetchEngine',
+    'AuthorDirectory',
     
     # Scrapers
     'BookScraper',
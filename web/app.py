@@ -15,7 +15,7 @@ from datetime import datetime
 from pathlib import Path
 
 try:
-    from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+    from flask import Flask, Response, render_template, request, jsonify, send_file, redirect, url_for
     from werkzeug.utils import secure_filename
 except ImportError as e:
     print(f"❌ Error: Missing required dependencies. Please install Flask:")
@@ -23,7 +23,8 @@ except ImportError as e:
     sys.exit(1)
 
 # Import the modular SINTA scraping components
-from . import SintaScrapingApp, Utils
+from . import SintaScrapingApp, Utils, config
+from .metrics import registry
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'sinta-scraping-web-2025'
@@ -39,6 +40,10 @@ scraping_status = {
     'output_dir': None
 }
 
+# Web scrape state, refreshed from scraping_status whenever /metrics is read
+scrape_running = registry.gauge('sinta_scrape_running', 'Whether a scrape started from the web interface is running')
+scrape_progress = registry.gauge('sinta_scrape_progress', 'Progress of the current web scrape in percent')
+
 def get_output_dir():
     """Get current output directory name"""
     return Utils.get_output_dir()
@@ -101,9 +106,10 @@ def save_lecturer_ids(lecturer_ids):
             if lecturer_id.strip():
                 f.write(f"{lecturer_id.strip()}\n")
 
-def run_scraping_command(categories):
+def run_scraping_command(categories, resume=False, incremental=False, since=None, until=None, profile=False):
     """Run scraping using the modular SINTA app"""
     global scraping_status
+    app = None
     
     try:
         scraping_status['running'] = True
@@ -112,6 +118,13 @@ def run_scraping_command(categories):
         scraping_status['start_time'] = datetime.now()
         scraping_status['output_dir'] = get_output_dir()
         
+        # Resume from the job journal, stop at known items and profile the stages if requested
+        config.set('journal.resume', resume)
+        config.set('incremental.enabled', incremental)
+        config.set('scraping.since', since)
+        config.set('scraping.until', until)
+        config.set('profiling.enabled', profile)
+        
         # Create SINTA app instance
         app = SintaScrapingApp()
         
@@ -169,6 +182,8 @@ def run_scraping_command(categories):
         scraping_status['results']['error'] = str(e)
     
     finally:
+        if app is not None:
+            app.close()
         scraping_status['running'] = False
 
 @app.route('/')
@@ -203,6 +218,16 @@ def start_scraping():
     
     data = request.get_json()
     categories = data.get('categories', [])
+    resume = bool(data.get('resume', False))
+    incremental = bool(data.get('incremental', False))
+    profile = bool(data.get('profile', False))
+    try:
+        since = int(data['since']) if data.get('since') else None
+        until = int(data['until']) if data.get('until') else None
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'error': 'since and until must be years'})
+    if since is not None and until is not None and since > until:
+        return jsonify({'success': False, 'error': f'since ({since}) is later than until ({until})'})
     
     # Reset status
     scraping_status = {
@@ -215,7 +240,7 @@ def start_scraping():
     }
     
     # Start scraping in background thread
-    thread = threading.Thread(target=run_scraping_command, args=(categories,))
+    thread = threading.Thread(target=run_scraping_command, args=(categories, resume, incremental, since, until, profile))
     thread.daemon = True
     thread.start()
     
@@ -232,6 +257,13 @@ def get_scraping_status():
     
     return jsonify(status)
 
+@app.route('/metrics')
+def get_metrics():
+    """Expose request, parse and output metrics in the Prometheus text format"""
+    scrape_running.set(1 if scraping_status['running'] else 0)
+    scrape_progress.set(scraping_status['progress'])
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/outputs')
 def get_outputs():
     """Get available output directories"""
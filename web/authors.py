@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Author directory for the SINTA scraping application
+
+This module keeps a persistent ID → name, affiliation and department map
+so each profile page is fetched at most once per run, and not at all
+while the saved entry is still fresh.
+"""
+
+import json
+import os
+import threading
+import time
+from .config import config
+from .profiling import stage
+from .scrapers.parser import make_soup
+from .scrapers.records import to_int
+
+
+# Stat-table column headers → the list view whose items its Article row counts
+STAT_TABLE_VIEWS = {'scopus': 'scopus', 'gscholar': 'googlescholar', 'wos': 'wos'}
+
+
+def parse_view_counts(soup):
+    """Read per-view item counts from the Article row of a profile's statistics table"""
+    table = soup.find('table', class_='stat-table')
+    if not table:
+        return {}
+
+    rows = table.find_all('tr')
+    if not rows:
+        return {}
+    header = [cell.text.strip().lower() for cell in rows[0].find_all(['th', 'td'])]
+    for row in rows[1:]:
+        cells = row.find_all(['th', 'td'])
+        if not cells or cells[0].text.strip() != 'Article':
+            continue
+        counts = {}
+        for name, cell in zip(header[1:], cells[1:]):
+            view = next((view for source, view in STAT_TABLE_VIEWS.items() if source in name), None)
+            count = to_int(cell.text)
+            if view and isinstance(count, int):
+                counts[view] = count
+        return counts
+    return {}
+
+
+def parse_author_summary(soup):
+    """Extract name, affiliation and department from a parsed profile page"""
+    profile_section = soup.find('div', class_='col-lg col-md')
+    if not profile_section:
+        return None
+
+    name_element = profile_section.find('h3').find('a')
+    if not name_element:
+        return None
+
+    affiliation_element = profile_section.find('a', href=lambda x: x and 'affiliations/profile' in x)
+    department_element = profile_section.find('a', href=lambda x: x and 'departments/profile' in x)
+    return {
+        'name': name_element.text.strip(),
+        'affiliation': affiliation_element.text.strip() if affiliation_element else None,
+        'department': department_element.text.strip() if department_element else None,
+        'counts': parse_view_counts(soup)
+    }
+
+
+class AuthorDirectory:
+    """Persistent directory of SINTA authors shared by every scraper"""
+
+    def __init__(self, session_manager, directory_file=None, ttl=None):
+        self.session = session_manager
+        self.directory_file = directory_file or config.get('authors.directory_file', '.config/authors.json')
+        self.ttl = float(ttl if ttl is not None else config.get('authors.ttl', 604800))
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._author_locks = {}
+        self.load()
+
+    def load(self):
+        """Load saved entries"""
+        try:
+            with open(self.directory_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Persist entries"""
+        with self._lock:
+            data = dict(self.entries)
+        directory = os.path.dirname(self.directory_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{self.directory_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.directory_file)
+
+    def _author_lock(self, author_id):
+        with self._lock:
+            return self._author_locks.setdefault(str(author_id), threading.Lock())
+
+    def is_fresh(self, entry, max_age=None):
+        """Check whether an entry was seen within max_age seconds (default: the TTL)"""
+        max_age = self.ttl if max_age is None else max_age
+        return entry is not None and time.time() - entry.get('last_seen', 0) <= max_age
+
+    def update(self, author_id, name, affiliation=None, department=None, counts=None):
+        """Record author details parsed from a profile page"""
+        with self._lock:
+            self.entries[str(author_id)] = {
+                'name': name,
+                'affiliation': affiliation,
+                'department': department,
+                'counts': counts or {},
+                'last_seen': time.time()
+            }
+
+    def update_from_soup(self, author_id, soup):
+        """Record author details from a parsed profile page, returning the entry"""
+        summary = parse_author_summary(soup)
+        if summary:
+            self.update(author_id, **summary)
+        return self.entries.get(str(author_id))
+
+    def lookup(self, author_id, max_age=None):
+        """Get the entry for an author, fetching the profile page if it is missing or stale"""
+        with self._author_lock(author_id):
+            entry = self.entries.get(str(author_id))
+            if self.is_fresh(entry, max_age):
+                return entry
+
+            try:
+                url = config.get_profile_url(author_id)
+                response = self.session.get(url, timeout=30)
+                with stage('parse'):
+                    soup = make_soup(response.content)
+                    return self.update_from_soup(author_id, soup) or entry
+            except Exception as e:
+                print(f"   ⚠️ Error getting author details for ID {author_id}: {e}")
+                return entry
+
+    def get_view_counts(self, author_id, max_age=None):
+        """Get an author's item counts per view from a profile page at most max_age seconds old"""
+        entry = self.lookup(author_id, max_age)
+        return (entry.get('counts') or {}) if entry else {}
+
+    def get_name(self, author_id):
+        """Get an author's name, falling back to a placeholder"""
+        entry = self.lookup(author_id)
+        return entry['name'] if entry else f"Author_{author_id}"
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the SINTA scraping application
+
+This module measures how fast each parser backend turns saved SINTA pages
+into records, with a full tree and with targeted list-view parsing, and
+checks that every combination produces identical records.
+
+The suite command runs every view over the checked-in fixture corpus in
+web/fixtures/ and reports pages/sec, items/sec and peak memory per view
+and backend. Parsed records are compared across backends and against the
+golden web/fixtures/expected.json, so a parser change that alters the
+output fails the run. Fixtures can be refreshed from a live run with
+--record-fixtures.
+
+The scaling command starts the local mock SINTA server (web.mock_server)
+in a separate process and runs SintaScrapingApp.scrape_all against it for
+N synthetic lecturers at each worker count, reporting throughput and
+request latency percentiles so the scaling curve can be read off.
+
+The requests command scrapes the mock server in every scheduling mode
+and checks, from both the server's per-page request counts (/__stats)
+and the fetch engine's url_counts, that every list page was requested
+exactly once.
+
+The resume command scrapes through a full outage (every page answered
+503), then resumes against a healthy server and then again during an
+outage. It checks that nothing failed was journaled, that the resumed
+run fetched every page exactly once, and that a complete journal
+replays every row without fetching.
+
+Usage:
+  python -m web.benchmark parsers scopus_1.html books_1.html --repeat 10
+  python -m web.benchmark suite --repeat 20
+  python -m web.benchmark suite --update-expected
+  python -m web.benchmark scaling --lecturers 20 --workers 1,2,4,8 --latency 0.05
+  python -m web.benchmark requests --lecturers 3 --pages 3
+  python -m web.benchmark resume --mode pipeline
+  python -m web.benchmark compare old/manifest-all-093000.json new/manifest-all-101500.json
+
+The compare command lists what changed between two run manifests
+(written next to the CSVs of every scrape) and flags regressions.
+
+The view of a page is taken from its file name up to the first '_' or '-'
+(books, iprs, researches, services, scopus, googlescholar, wos, profile).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlparse
+from .config import config
+from .manifest import compare_manifests, load_manifest
+from .mock_server import LIST_VIEWS, add_site_arguments, parse_view_pages
+from .scrapers.book_scraper import BookScraper
+from .scrapers.haki_scraper import HakiScraper
+from .scrapers.publication_scraper import PublicationScraper
+from .scrapers.research_scraper import ResearchScraper
+from .scrapers.community_service_scraper import CommunityServiceScraper
+from .scrapers.profile_scraper import ProfileScraper
+from .scrapers.parser import LIST_VIEW_STRAINER, get_available_backends, make_soup
+
+
+# View → (scraper class, page parser method)
+VIEW_PARSERS = {
+    'books': (BookScraper, 'parse_page'),
+    'iprs': (HakiScraper, 'parse_page'),
+    'researches': (ResearchScraper, 'parse_page'),
+    'services': (CommunityServiceScraper, 'parse_page'),
+    'scopus': (PublicationScraper, 'parse_scopus_page'),
+    'googlescholar': (PublicationScraper, 'parse_google_scholar_page'),
+    'wos': (PublicationScraper, 'parse_wos_page'),
+    'profile': (ProfileScraper, 'parse_profile')
+}
+
+# The profile page is not a list view and is always parsed as a full tree
+FULL_TREE_VIEWS = {'profile'}
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+EXPECTED_FILE = 'expected.json'
+
+
+def detect_view(path):
+    """Get the view of a saved page from its file name"""
+    view = re.split(r'[_\-.]', Path(path).name, maxsplit=1)[0]
+    if view not in VIEW_PARSERS:
+        raise ValueError(f"Cannot tell the view of {path}; name it <view>_<n>.html")
+    return view
+
+
+def parse_records(view, content, backend, targeted=True):
+    """Parse one saved page into records with a given backend"""
+    scraper_class, method = VIEW_PARSERS[view]
+    parse_func = getattr(scraper_class(None), method)
+    if view in FULL_TREE_VIEWS:
+        return [parse_func(make_soup(content, backend), 0, 'Benchmark')]
+    soup = make_soup(content, backend, LIST_VIEW_STRAINER if targeted else None)
+    return parse_func(soup, 0, 'Benchmark')
+
+
+def benchmark_parsers(pages, repeat=5, backends=None):
+    """Time every backend, with and without targeted parsing, over (view, content) pages
+
+    Returns {(backend, mode): {'pages_per_sec', 'seconds', 'identical'}},
+    where identical compares records against a full html.parser tree.
+    """
+    backends = backends or get_available_backends()
+    reference = [parse_records(view, content, 'html.parser', targeted=False) for view, content in pages]
+    results = {}
+
+    for backend in backends:
+        for mode, targeted in [('full', False), ('targeted', True)]:
+            records = [parse_records(view, content, backend, targeted) for view, content in pages]
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for view, content in pages:
+                    parse_records(view, content, backend, targeted)
+            elapsed = time.perf_counter() - start
+            results[(backend, mode)] = {
+                'pages_per_sec': len(pages) * repeat / elapsed if elapsed else float('inf'),
+                'seconds': elapsed,
+                'identical': records == reference
+            }
+    return results
+
+
+def run_parsers(args):
+    """Run the parser backend benchmark"""
+    pages = [(detect_view(path), Path(path).read_bytes()) for path in args.pages]
+    print(f"📊 Benchmarking {len(pages)} pages x {args.repeat} rounds")
+    print("-" * 50)
+    for (backend, mode), result in benchmark_parsers(pages, args.repeat).items():
+        status = "✅ identical" if result['identical'] else "❌ records differ"
+        print(f"{backend:<12} {mode:<9} {result['pages_per_sec']:>10.1f} pages/sec   {status}")
+
+
+def load_fixtures(directory):
+    """Get the saved pages of a fixtures directory as {view: [(file name, content)]}"""
+    fixtures = {}
+    for path in sorted(Path(directory).glob('*.html')):
+        fixtures.setdefault(detect_view(path), []).append((path.name, path.read_bytes()))
+    return fixtures
+
+
+def to_plain(records):
+    """Records as JSON-ready dicts, for comparing against the golden file"""
+    return json.loads(json.dumps([dict(record) for record in records], ensure_ascii=False))
+
+
+def benchmark_view(view, pages, backend, repeat=5, targeted=True):
+    """Time one view's pages with one backend
+
+    Returns the parsed records of every page and a result dict with
+    pages_per_sec, items_per_sec and peak_kib, the peak memory traced
+    while parsing the pages once.
+    """
+    tracemalloc.start()
+    records = [parse_records(view, content, backend, targeted) for _, content in pages]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    items = sum(len(page_records) for page_records in records)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, content in pages:
+            parse_records(view, content, backend, targeted)
+    elapsed = time.perf_counter() - start
+    return records, {
+        'pages_per_sec': len(pages) * repeat / elapsed if elapsed else float('inf'),
+        'items_per_sec': items * repeat / elapsed if elapsed else float('inf'),
+        'peak_kib': peak / 1024
+    }
+
+
+def run_suite(args):
+    """Run every view's parser over the fixture corpus"""
+    directory = Path(args.fixtures)
+    fixtures = load_fixtures(directory)
+    if not fixtures:
+        print(f"❌ No fixtures found in {directory}")
+        return 1
+
+    expected_file = directory / EXPECTED_FILE
+    expected = {}
+    if expected_file.exists() and not args.update_expected:
+        with open(expected_file, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+
+    backends = args.backend or get_available_backends()
+    targeted = not args.full_tree
+    pages_total = sum(len(pages) for pages in fixtures.values())
+    print(f"📊 Benchmarking {pages_total} fixture pages x {args.repeat} rounds "
+          f"({'targeted' if targeted else 'full tree'} parsing)")
+    print("-" * 78)
+    print(f"{'view':<14} {'backend':<12} {'pages/sec':>10} {'items/sec':>11} {'peak KiB':>10}   check")
+
+    failures = 0
+    golden = {}
+    for view, pages in fixtures.items():
+        reference = [to_plain(parse_records(view, content, 'html.parser', targeted=False)) for _, content in pages]
+        for (name, _), records in zip(pages, reference):
+            golden[name] = records
+
+        for backend in backends:
+            records, result = benchmark_view(view, pages, backend, args.repeat, targeted)
+            problems = []
+            if [to_plain(page_records) for page_records in records] != reference:
+                problems.append("differs from html.parser")
+            if not args.update_expected:
+                for (name, _), page_records in zip(pages, reference):
+                    if name in expected and expected[name] != page_records:
+                        problems.append(f"{name} differs from {EXPECTED_FILE}")
+            if not any(reference):
+                problems.append("no items parsed")
+
+            failures += bool(problems)
+            status = "✅ ok" if not problems else "❌ " + "; ".join(problems)
+            print(f"{view:<14} {backend:<12} {result['pages_per_sec']:>10.1f} "
+                  f"{result['items_per_sec']:>11.1f} {result['peak_kib']:>10.1f}   {status}")
+
+    if args.update_expected:
+        with open(expected_file, 'w', encoding='utf-8') as f:
+            json.dump(golden, f, ensure_ascii=False, indent=1, sort_keys=True)
+        print(f"💾 Wrote expected records of {len(golden)} pages to {expected_file}")
+    elif not expected:
+        print(f"⚠️ No {EXPECTED_FILE} in {directory}; run with --update-expected to create it")
+
+    if failures:
+        print(f"❌ {failures} view/backend combinations failed")
+        return 1
+    return 0
+
+
+def percentile(values, fraction):
+    """Get the value below which a fraction of sorted values fall"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(fraction * (len(values) - 1)))))
+    return values[index]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _server_stats(base_url):
+    with urllib.request.urlopen(f"{base_url}/__stats", timeout=5) as response:
+        return json.load(response)
+
+
+@contextlib.contextmanager
+def mock_server_process(args):
+    """Run web.mock_server in a child process with the site options of args, yielding its base URL"""
+    port = _free_port()
+    command = [sys.executable, '-m', 'web.mock_server', '--port', str(port),
+               '--pages', str(args.pages), '--items', str(args.items),
+               '--latency', str(args.latency), '--jitter', str(args.jitter),
+               '--error-rate', str(args.error_rate),
+               '--username', args.username, '--password', args.password]
+    for value in args.view_pages or []:
+        command += ['--view-pages', value]
+    if args.fixtures:
+        command += ['--fixtures', args.fixtures]
+
+    process = subprocess.Popen(command, cwd=str(Path(__file__).parent.parent),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                _server_stats(base_url)
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("Mock SINTA server did not start")
+                time.sleep(0.05)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def _count_rows(results):
+    total = 0
+    for count in results.values():
+        total += _count_rows(count) if isinstance(count, dict) else (count or 0)
+    return total
+
+
+def run_scrape(base_url, lecturers, workers, work_dir, mode='category', credentials=('mock', 'mock'), verbose=False,
+               journal_file=None):
+    """Run scrape_all against a mock server with every worker pool set to workers
+
+    With a journal_file the run journals its pages there, resuming from
+    whatever an earlier run left in it.
+
+    Returns a result dict with seconds, requests (including retries),
+    retries, rows, the sorted per-request latencies in seconds, and the
+    fetch engine's request count per URL.
+    """
+    from .sinta_app import SintaScrapingApp
+
+    run_dir = Path(work_dir) / f"workers-{workers}"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    roster = run_dir / 'dosen.txt'
+    roster.write_text(''.join(f"{author_id}\n" for author_id in lecturers), encoding='utf-8')
+
+    config.set('session.base_url', base_url)
+    config.set('session.session_file', str(run_dir / 'session_data.json'))
+    config.set('authors.directory_file', str(run_dir / 'authors.json'))
+    config.set('output.directory_format', str(run_dir / 'output'))
+    config.set('cache.enabled', False)
+    config.set('journal.enabled', journal_file is not None)
+    if journal_file is not None:
+        config.set('journal.file', str(journal_file))
+        config.set('journal.resume', True)
+    config.set('incremental.enabled', False)
+    config.set('scraping.request_delay', 0)
+    for key in ('scraping.max_workers', 'scraping.page_workers', 'scraping.view_workers', 'pipeline.fetch_workers'):
+        config.set(key, workers)
+    os.environ['SINTA_USERNAME'], os.environ['SINTA_PASSWORD'] = credentials
+
+    latencies = []
+    lock = threading.Lock()
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        app = SintaScrapingApp()
+        app.lecturer_manager.config_file = str(roster)
+        fetcher = app.session_manager.fetcher
+        fetch = fetcher.get
+
+        def timed_get(url, timeout=30):
+            started = time.perf_counter()
+            try:
+                return fetch(url, timeout=timeout)
+            finally:
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+
+        fetcher.get = timed_get
+        try:
+            started = time.perf_counter()
+            if not app.initialize():
+                raise RuntimeError("Could not log in to the mock SINTA server")
+            results = app.scrape_all(author_major=(mode == 'author-major'), pipeline=(mode == 'pipeline'))
+            elapsed = time.perf_counter() - started
+        finally:
+            app.close()
+
+    return {
+        'seconds': elapsed,
+        'requests': fetcher.request_count,
+        'retries': fetcher.retry_policy.retry_count,
+        'rows': _count_rows(results),
+        'latencies': sorted(latencies),
+        'url_counts': dict(fetcher.url_counts)
+    }
+
+
+def run_scaling(args):
+    """Sweep worker counts against the mock SINTA server"""
+    worker_counts = [int(value) for value in args.workers.split(',') if value.strip()]
+    lecturers = [100000 + i for i in range(args.lecturers)]
+    print(f"📊 Scaling benchmark: {args.lecturers} lecturers, {args.pages} pages per view, "
+          f"{args.latency * 1000:.0f} ms latency, {args.error_rate:.1%} errors, mode {args.mode}")
+    print("-" * 96)
+    print(f"{'workers':>7} {'seconds':>9} {'requests':>9} {'req/sec':>9} {'lect/min':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'retries':>8} {'rows':>8}")
+
+    results = []
+    with mock_server_process(args) as base_url, tempfile.TemporaryDirectory(prefix='sinta-scaling-') as work_dir:
+        for workers in worker_counts:
+            before = _server_stats(base_url)
+            result = run_scrape(base_url, lecturers, workers, work_dir, args.mode,
+                                (args.username, args.password), args.verbose)
+            after = _server_stats(base_url)
+            result['workers'] = workers
+            result['server_errors'] = after['errors'] - before['errors']
+            latencies = result.pop('latencies')
+            result.pop('url_counts')
+            result.update({
+                'requests_per_sec': result['requests'] / result['seconds'],
+                'lecturers_per_min': len(lecturers) * 60 / result['seconds'],
+                'p50_ms': percentile(latencies, 0.50) * 1000,
+                'p95_ms': percentile(latencies, 0.95) * 1000,
+                'p99_ms': percentile(latencies, 0.99) * 1000
+            })
+            results.append(result)
+            print(f"{workers:>7} {result['seconds']:>9.2f} {result['requests']:>9} {result['requests_per_sec']:>9.1f} "
+                  f"{result['lecturers_per_min']:>9.1f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+                  f"{result['p99_ms']:>8.1f} {result['retries']:>8} {result['rows']:>8}")
+
+    if results:
+        base = results[0]
+        print("-" * 96)
+        for result in results[1:]:
+            speedup = base['seconds'] / result['seconds']
+            print(f"⚡ {result['workers']} workers: {speedup:.2f}x the throughput of {base['workers']} "
+                  f"({speedup / (result['workers'] / base['workers']):.0%} scaling efficiency)")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+    return 0
+
+
+def _list_page_counts(url_counts):
+    """Keep the request counts of list-view pages, keyed by path and query"""
+    counts = {}
+    for url, count in url_counts.items():
+        parsed = urlparse(url)
+        if 'view=' in parsed.query:
+            key = f"{parsed.path}?{parsed.query}"
+            counts[key] = counts.get(key, 0) + count
+    return counts
+
+
+def run_requests(args):
+    """Scrape the mock SINTA server in every mode, returning 1 unless each list page was requested exactly once"""
+    if args.error_rate:
+        print("❌ Injected errors cause retries, which request pages again; use --error-rate 0")
+        return 1
+    modes = args.mode or ['category', 'author-major', 'pipeline']
+    lecturers = [100000 + i for i in range(args.lecturers)]
+    view_pages = parse_view_pages(args.view_pages)
+    expected = {
+        f"/authors/profile/{author_id}?page={page}&view={view}"
+        for author_id in lecturers
+        for view in LIST_VIEWS
+        for page in range(1, view_pages.get(view, args.pages) + 1)
+    }
+    print(f"🔍 Request check: {args.lecturers} lecturers, {args.pages} pages per view, "
+          f"{len(expected)} list pages per run")
+
+    failures = 0
+    with mock_server_process(args) as base_url, tempfile.TemporaryDirectory(prefix='sinta-requests-') as work_dir:
+        for mode in modes:
+            before = _server_stats(base_url)['page_requests']
+            result = run_scrape(base_url, lecturers, args.workers, Path(work_dir) / mode, mode,
+                                (args.username, args.password), args.verbose)
+            after = _server_stats(base_url)['page_requests']
+            served = _list_page_counts({url: count - before.get(url, 0) for url, count in after.items()})
+            sent = _list_page_counts(result['url_counts'])
+
+            problems = []
+            for name, counts in (('server', served), ('fetch engine', sent)):
+                repeated = sorted(url for url, count in counts.items() if count > 1)
+                missing = sorted(expected - {url for url, count in counts.items() if count})
+                unexpected = sorted(set(counts) - expected)
+                for label, urls in (('requested more than once', repeated), ('never requested', missing),
+                                    ('not a page of the view', unexpected)):
+                    if urls:
+                        problems.append(f"{name}: {len(urls)} pages {label}, e.g. {urls[0]}")
+
+            if problems:
+                failures += 1
+                print(f"❌ {mode:<13} {sum(served.values())} list page requests")
+                for problem in problems:
+                    print(f"   {problem}")
+            else:
+                print(f"✅ {mode:<13} {sum(served.values())} list page requests, each page exactly once")
+    return 1 if failures else 0
+
+
+def _journaled_units(journal_file):
+    """Read the (author, view, page) units of a journal file"""
+    if not os.path.exists(journal_file):
+        return set()
+    with open(journal_file, 'r', encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    return {(str(entry['author_id']), entry['view'], entry['page']) for entry in entries}
+
+
+def run_resume(args):
+    """Check that pages which failed are not journaled and are fetched again on resume, returning 1 on a problem"""
+    lecturers = [100000 + i for i in range(args.lecturers)]
+    view_pages = parse_view_pages(args.view_pages)
+    pages = {view: view_pages.get(view, args.pages) for view in LIST_VIEWS}
+    expected_rows = len(lecturers) * (sum(pages.values()) * args.items + 1)
+    list_pages = len(lecturers) * sum(pages.values())
+    print(f"🔍 Resume check: {args.lecturers} lecturers, {list_pages} list pages, mode {args.mode}")
+    # Pages in an outage fail for good, so do not wait long between their retries
+    config.set('scraping.retry_backoff', 0.01)
+    config.set('scraping.retry_max_backoff', 0.01)
+
+    failures = []
+    with tempfile.TemporaryDirectory(prefix='sinta-resume-') as work_dir:
+        journal_file = Path(work_dir) / 'journal.jsonl'
+        runs = [('outage', 1.0), ('resume', 0.0), ('replay', 1.0)]
+        for step, error_rate in runs:
+            site_args = argparse.Namespace(**{**vars(args), 'error_rate': error_rate})
+            with mock_server_process(site_args) as base_url:
+                result = run_scrape(base_url, lecturers, args.workers, Path(work_dir) / step, args.mode,
+                                    (args.username, args.password), args.verbose, journal_file)
+                served = _list_page_counts(_server_stats(base_url)['page_requests'])
+            units = _journaled_units(journal_file)
+            rows = result['rows']
+
+            if step == 'outage':
+                ok = not units
+                print(f"{'✅' if ok else '❌'} every page answered 503: {len(units)} units journaled")
+                if not ok:
+                    failures.append(f"pages that failed were journaled, e.g. {sorted(units)[0]}")
+            elif step == 'resume':
+                repeated = sorted(url for url, count in served.items() if count > 1)
+                ok = len(served) == list_pages and not repeated and rows == expected_rows
+                print(f"{'✅' if ok else '❌'} resumed: {len(served)}/{list_pages} list pages fetched, "
+                      f"{rows}/{expected_rows} rows, {len(units)} units journaled")
+                if not ok:
+                    failures.append("the resumed run did not fetch every failed page exactly once")
+            else:
+                ok = not served and rows == expected_rows
+                print(f"{'✅' if ok else '❌'} replayed during an outage: {len(served)} list pages fetched, "
+                      f"{rows}/{expected_rows} rows")
+                if not ok:
+                    failures.append("a complete journal did not replay every page")
+
+    for failure in failures:
+        print(f"   {failure}")
+    return 1 if failures else 0
+
+
+def run_compare(args):
+    """Print a comparison of two run manifests, returning 1 if anything regressed"""
+    old, new = load_manifest(args.old), load_manifest(args.new)
+    print(f"📊 {args.old} ({old.get('started_at')}) → {args.new} ({new.get('started_at')})")
+    old_settings = old.get('settings', {})
+    for key, value in new.get('settings', {}).items():
+        if old_settings.get(key) != value:
+            print(f"   ⚙️ {key}: {old_settings.get(key)} → {value}")
+    print("-" * 74)
+    print(f"{'category':<18} {'metric':<16} {'old':>12} {'new':>12} {'change':>9}")
+
+    regressions = 0
+    for target, metric, old_value, new_value, change, regression in compare_manifests(old, new, args.threshold):
+        if not args.all and old_value == new_value:
+            continue
+        change_text = '' if change is None else ('new' if change == float('inf') else f"{change:+.0%}")
+        flag = '  ⚠️' if regression else ''
+        print(f"{target:<18} {metric:<16} {old_value:>12} {new_value:>12} {change_text:>9}{flag}")
+        regressions += regression
+
+    print("-" * 74)
+    if regressions:
+        print(f"⚠️ {regressions} regressions above {args.threshold:.0%}")
+        return 1
+    print("✅ No regressions")
+    return 0
+
+
+def create_argument_parser():
+    """Create command line argument parser"""
+    parser = argparse.ArgumentParser(description='Offline benchmarks for SINTA scrapers')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    parsers_cmd = subparsers.add_parser('parsers', help='Compare parser backends on saved pages')
+    parsers_cmd.add_argument('pages', nargs='+', help='Saved SINTA pages named <view>_<n>.html')
+    parsers_cmd.add_argument('--repeat', type=int, default=5, help='Parsing rounds per backend (default: 5)')
+    parsers_cmd.set_defaults(func=run_parsers)
+
+    suite_cmd = subparsers.add_parser('suite', help='Benchmark every view on the fixture corpus')
+    suite_cmd.add_argument('--fixtures', default=str(FIXTURES_DIR), help='Fixture directory (default: web/fixtures)')
+    suite_cmd.add_argument('--repeat', type=int, default=5, help='Parsing rounds per view and backend (default: 5)')
+    suite_cmd.add_argument('--backend', action='append', choices=['lxml', 'html.parser'], help='Only benchmark this backend (repeatable)')
+    suite_cmd.add_argument('--full-tree', action='store_true', help='Parse list views as full trees instead of targeted parsing')
+    suite_cmd.add_argument('--update-expected', action='store_true', help=f'Rewrite {EXPECTED_FILE} from the current html.parser output')
+    suite_cmd.set_defaults(func=run_suite)
+
+    scaling_cmd = subparsers.add_parser('scaling', help='Sweep worker counts against a local mock SINTA server')
+    scaling_cmd.add_argument('--lecturers', type=int, default=10, help='Synthetic lecturers to scrape (default: 10)')
+    scaling_cmd.add_argument('--workers', default='1,2,4,8', help='Comma-separated worker counts to sweep (default: 1,2,4,8)')
+    scaling_cmd.add_argument('--mode', choices=['category', 'author-major', 'pipeline'], default='category',
+                             help='scrape_all scheduling to benchmark (default: category)')
+    scaling_cmd.add_argument('--json', metavar='FILE', help='Also write the results as JSON')
+    scaling_cmd.add_argument('--verbose', action='store_true', help='Show the scraper output')
+    add_site_arguments(scaling_cmd)
+    scaling_cmd.set_defaults(func=run_scaling)
+
+    requests_cmd = subparsers.add_parser('requests', help='Check that a scrape requests every list page exactly once')
+    requests_cmd.add_argument('--lecturers', type=int, default=3, help='Synthetic lecturers to scrape (default: 3)')
+    requests_cmd.add_argument('--workers', type=int, default=4, help='Workers per pool (default: 4)')
+    requests_cmd.add_argument('--mode', action='append', choices=['category', 'author-major', 'pipeline'],
+                              help='Only check this scrape_all scheduling (repeatable, default: all)')
+    requests_cmd.add_argument('--verbose', action='store_true', help='Show the scraper output')
+    add_site_arguments(requests_cmd)
+    requests_cmd.set_defaults(func=run_requests)
+
+    resume_cmd = subparsers.add_parser('resume', help='Check that failed pages are not journaled and are refetched on resume')
+    resume_cmd.add_argument('--lecturers', type=int, default=3, help='Synthetic lecturers to scrape (default: 3)')
+    resume_cmd.add_argument('--workers', type=int, default=4, help='Workers per pool (default: 4)')
+    resume_cmd.add_argument('--mode', choices=['category', 'author-major', 'pipeline'], default='category',
+                            help='scrape_all scheduling to check (default: category)')
+    resume_cmd.add_argument('--verbose', action='store_true', help='Show the scraper output')
+    add_site_arguments(resume_cmd)
+    resume_cmd.set_defaults(func=run_resume)
+
+    compare_cmd = subparsers.add_parser('compare', help='Compare two run manifests and flag regressions')
+    compare_cmd.add_argument('old', help='Baseline manifest')
+    compare_cmd.add_argument('new', help='Manifest to check against the baseline')
+    compare_cmd.add_argument('--threshold', type=float, default=0.1, help='Relative increase reported as a regression (default: 0.1 = 10%%)')
+    compare_cmd.add_argument('--all', action='store_true', help='Also list unchanged metrics')
+    compare_cmd.set_defaults(func=run_compare)
+
+    return parser
+
+
+def main(argv=None):
+    """Main benchmark entry point"""
+    parser = create_argument_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP response cache for SINTA pages
+
+This module stores successful page responses as gzip files addressed by
+the SHA-256 of their URL (which carries the view and page), expires them
+after a TTL and evicts the least recently used entries once the cache
+grows past its size limit. In offline mode the cache is the only source
+of pages and a miss raises CacheMissError instead of touching the network.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from .config import config
+
+
+class CacheMissError(Exception):
+    """Raised in offline mode when a URL is not in the cache"""
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response served from the cache"""
+
+    def __init__(self, url, status_code, content):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+
+class ResponseCache:
+    """Compressed, size-bounded LRU cache of page responses with a TTL"""
+
+    def __init__(self, directory, ttl=86400, max_size=512 * 1024 * 1024, offline=False):
+        self.directory = Path(directory)
+        self.ttl = float(ttl)
+        self.max_size = int(max_size)
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._size = None
+
+    @classmethod
+    def from_config(cls):
+        """Create the cache from the cache.* settings, or None if it is disabled"""
+        offline = bool(config.get('cache.offline', False))
+        if not config.get('cache.enabled', True) and not offline:
+            return None
+        return cls(
+            directory=config.get('cache.directory', '.config/cache'),
+            ttl=config.get('cache.ttl', 86400),
+            max_size=int(config.get('cache.max_size_mb', 512)) * 1024 * 1024,
+            offline=offline
+        )
+
+    def _path(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / key[:2] / f"{key}.gz"
+
+    def get(self, url):
+        """Get a cached response, or None if missing or expired"""
+        path = self._path(url)
+        try:
+            with gzip.open(path, 'rb') as f:
+                header = json.loads(f.readline())
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # Expired entries still serve offline runs; that is the point of replay
+        if not self.offline and time.time() - header['fetched_at'] > self.ttl:
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return CachedResponse(header['url'], header['status_code'], content)
+
+    def put(self, url, response):
+        """Store a successful response"""
+        if response.status_code != 200 or 'login' in response.url:
+            return
+
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = {'url': response.url, 'status_code': response.status_code, 'fetched_at': time.time()}
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            f.write(response.content)
+        old_size = path.stat().st_size if path.exists() else 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += path.stat().st_size - old_size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _entries(self):
+        return [p for p in self.directory.glob('*/*.gz') if p.is_file()]
+
+    def _scan_size(self):
+        return sum(p.stat().st_size for p in self._entries())
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is under 90% of its limit"""
+        entries = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+        size = sum(p.stat().st_size for p in entries)
+        target = self.max_size * 0.9
+        for path in entries:
+            if size <= target:
+                break
+            try:
+                entry_size = path.stat().st_size
+                path.unlink()
+                size -= entry_size
+            except OSError:
+                continue
+        self._size = size
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock:
+            for path in self._entries():
+                path.unlink()
+            self._size = 0
@@ -22,19 +22,73 @@ class ConfigManager:
         """Load default configuration"""
         self.config = {
             'session': {
-                'test_url': 'https://sinta.kemdikbud.go.id/authors',
-                'login_url': 'https://sinta.kemdikbud.go.id/logins',
+                'base_url': 'https://sinta.kemdikbud.go.id',
+                'test_url': None,
+                'login_url': None,
                 'session_file': '.config/session_data.json'
             },
             'scraping': {
                 'request_delay': 1,
+                'burst': 3,
                 'max_retries': 3,
+                'retry_backoff': 1.0,
+                'retry_max_backoff': 60.0,
+                'max_retry_after': 300.0,
+                'max_workers': 4,
+                'page_workers': 4,
+                'view_workers': 4,
+                'parse_processes': 0,
+                'author_major': False,
+                'parser': 'auto',
+                'targeted_parse': True,
+                'since': None,
+                'until': None,
                 'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
             },
+            'pipeline': {
+                'enabled': False,
+                'fetch_workers': 4,
+                'parse_workers': 2,
+                'queue_size': 32,
+                'window': 8
+            },
+            'cache': {
+                'enabled': True,
+                'directory': '.config/cache',
+                'ttl': 86400,
+                'max_size_mb': 512,
+                'offline': False
+            },
+            'journal': {
+                'enabled': True,
+                'file': '.config/journal.jsonl',
+                'resume': False
+            },
+            'planning': {
+                'enabled': True,
+                'max_age': 86400
+            },
+            'incremental': {
+                'enabled': False,
+                'directory': '.config/incremental'
+            },
+            'fixtures': {
+                'record_dir': None
+            },
+            'profiling': {
+                'enabled': False,
+                'traceback_frames': 10
+            },
             'output': {
                 'directory_format': 'output-{date}',
                 'date_format': '%d%m%Y',
-                'csv_encoding': 'utf-8'
+                'csv_encoding': 'utf-8',
+                'flush_every': 500,
+                'flush_interval': 5
+            },
+            'authors': {
+                'directory_file': '.config/authors.json',
+                'ttl': 604800
             },
             'lecturers': {
                 'config_file': 'dosen.txt'
@@ -57,11 +111,28 @@ class ConfigManager:
         except (KeyError, TypeError):
             return default
     
+    def set(self, key_path, value):
+        """Set configuration value by dot notation (e.g., 'scraping.max_workers')"""
+        keys = key_path.split('.')
+        section = self.config
+        for key in keys[:-1]:
+            section = section.setdefault(key, {})
+        section[keys[-1]] = value
+    
+    def get_base_url(self) -> str:
+        """Get the SINTA site root, without a trailing slash"""
+        return str(self.get('session.base_url') or 'https://sinta.kemdikbud.go.id').rstrip('/')
+    
+    def get_profile_url(self, author_id) -> str:
+        """Get the profile page URL of an author"""
+        return f"{self.get_base_url()}/authors/profile/{author_id}"
+    
     def get_session_config(self) -> dict:
         """Get session configuration"""
+        base_url = self.get_base_url()
         return {
-            'test_url': str(self.get('session.test_url', 'https://sinta.kemdikbud.go.id/authors')),
-            'login_url': str(self.get('session.login_url', 'https://sinta.kemdikbud.go.id/logins')),
+            'test_url': str(self.get('session.test_url') or f"{base_url}/authors"),
+            'login_url': str(self.get('session.login_url') or f"{base_url}/logins"),
             'session_file': str(self.get('session.session_file', '.config/session_data.json'))
         }
     
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Concurrent fetch engine for the SINTA scraping application
+
+This module runs SINTA requests on a pool of worker threads. Every worker
+gets its own requests session cloned from the logged-in SessionManager
+session, so cookies are shared but connection state is not. All workers
+draw from one token bucket so the combined request rate is bounded, and
+transient failures are retried with backoff; a page that still fails
+raises instead of being returned as an error page. Successful responses go
+through the on-disk response cache, and in record mode are also saved as
+benchmark fixtures.
+"""
+
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import requests
+from .cache import ResponseCache, CacheMissError
+from .config import config
+from .metrics import CACHE_HITS, record_request, url_view
+from .profiling import staged
+from .rate_limiter import TokenBucket
+from .recorder import FixtureRecorder
+from .retry import RetryPolicy
+
+
+class FetchEngine:
+    """Run SINTA requests concurrently with one cloned session per worker"""
+
+    def __init__(self, session_manager, max_workers=None):
+        self.session_manager = session_manager
+        if max_workers is None:
+            max_workers = config.get('scraping.max_workers', 4)
+        self.max_workers = max(1, int(max_workers))
+        self.page_workers = max(1, int(config.get('scraping.page_workers', 4)))
+        self.view_workers = max(1, int(config.get('scraping.view_workers', 4)))
+        self._executors = {}
+        self.rate_limiter = TokenBucket.from_config()
+        self.retry_policy = RetryPolicy.from_config()
+        self.cache = ResponseCache.from_config()
+        self.cache_hits = 0
+        self.recorder = FixtureRecorder.from_config()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.url_counts = Counter()
+
+    @property
+    def request_count(self):
+        """Total number of requests made through this engine"""
+        with self._lock:
+            return sum(self.url_counts.values())
+
+    def reset_counters(self):
+        """Clear the per-URL request and cache hit counters"""
+        with self._lock:
+            self.url_counts.clear()
+            self.cache_hits = 0
+
+    def reset_sessions(self):
+        """Drop cloned sessions so workers pick up fresh cookies"""
+        self._local = threading.local()
+
+    def get_session(self):
+        """Get the requests session owned by the current worker"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self.session_manager.clone_session()
+            self._local.session = session
+        return session
+
+    @staged('fetch')
+    def get(self, url, timeout=30):
+        """Perform a GET request with the current worker's session, using the response cache
+
+        Raises requests.HTTPError if the response is still not a 200 once
+        retries run out.
+        """
+        view = url_view(url)
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                with self._lock:
+                    self.cache_hits += 1
+                CACHE_HITS.inc(view=view)
+                if self.recorder is not None:
+                    self.recorder.record(url, cached)
+                return cached
+            if self.cache.offline:
+                raise CacheMissError(f"Not in cache: {url}")
+
+        session = self.get_session()
+
+        def request():
+            with self._lock:
+                self.url_counts[url] += 1
+            self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = session.get(url, timeout=timeout)
+            except Exception:
+                record_request(view, 'error', time.perf_counter() - started)
+                raise
+            record_request(view, response.status_code, time.perf_counter() - started, len(response.content))
+            return response
+
+        response = self.retry_policy.call(request, url)
+        if response.status_code != 200:
+            # Out of retries: an error page must not be parsed as an empty page
+            raise requests.HTTPError(f"HTTP {response.status_code} for {url}", response=response)
+        if self.cache is not None:
+            self.cache.put(url, response)
+        if self.recorder is not None:
+            self.recorder.record(url, response)
+        return response
+
+    def imap(self, func, items, window=None):
+        """Apply func to every item concurrently, yielding results lazily in input order
+
+        Items are taken from the input only as results are consumed, with at
+        most window (default twice the worker count) submitted and not yet
+        yielded, so finished results cannot pile up behind a slow item at the
+        head of a long input.
+        """
+        if self.max_workers == 1:
+            for item in items:
+                yield func(item)
+            return
+
+        window = max(self.max_workers, int(window or 2 * self.max_workers))
+        items = iter(items)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for item in islice(items, window):
+                    pending.append(executor.submit(func, item))
+                while pending:
+                    result = pending.popleft().result()
+                    for item in islice(items, 1):
+                        pending.append(executor.submit(func, item))
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def map(self, func, items):
+        """Apply func to every item concurrently, returning results in input order"""
+        return list(self.imap(func, items))
+
+    def _map_on_pool(self, name, max_workers, func, items):
+        """Apply func to items on a persistent named pool, yielding results in input order"""
+        items = list(items)
+        if max_workers == 1 or len(items) <= 1:
+            return (func(item) for item in items)
+
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'sinta-{name}')
+                self._executors[name] = executor
+        return executor.map(func, items)
+
+    def map_views(self, func, views):
+        """Apply func to every view of one author on the shared view pool, in view order
+
+        View tasks may block on the page pool but never on the view pool
+        itself, so the nesting author → view → page cannot deadlock.
+        """
+        return list(self._map_on_pool('view', self.view_workers, func, views))
+
+    def map_pages(self, func, pages):
+        """Apply func to every page on the shared page pool, yielding results in page order
+
+        Page fetches never submit further work, so author and view workers
+        can block on them without exhausting the pool.
+        """
+        return self._map_on_pool('page', self.page_workers, func, pages)
+
+    def shutdown(self):
+        """Stop the shared view and page pools"""
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=True)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Item store for incremental scraping
+
+This module keeps the rows each (author, view) produced on the last
+complete run, one JSON file per view. In incremental mode the scrapers
+page through a view only until a page holds nothing new, then reuse the
+stored rows for the rest of the view instead of fetching it again.
+"""
+
+import json
+import os
+import threading
+from .config import config
+from .scrapers.records import dump_rows, load_rows
+
+
+class ItemStore:
+    """Previous rows of every (author, view), used as the incremental baseline"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or str(config.get('incremental.directory', '.config/incremental'))
+        self.views = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        """Open the configured store, or None if incremental mode is off"""
+        if not config.get('incremental.enabled', False):
+            return None
+        return cls()
+
+    def _view_file(self, view):
+        return os.path.join(self.directory, f"{view}.json")
+
+    def _load_view(self, view):
+        """Get the saved entries of a view, reading its file the first time"""
+        entries = self.views.get(view)
+        if entries is None:
+            try:
+                with open(self._view_file(view), 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            self.views[view] = entries
+        return entries
+
+    def get_rows(self, author_id, view):
+        """Get the rows of an author's view from the last complete run, or None if there are none"""
+        with self._lock:
+            entry = self._load_view(view).get(str(author_id))
+        if entry is None:
+            return None
+        return load_rows(entry.get('record'), entry['rows'])
+
+    def update(self, author_id, view, rows):
+        """Replace the stored rows of an author's view"""
+        record_name, data = dump_rows(rows)
+        with self._lock:
+            self._load_view(view)[str(author_id)] = {'record': record_name, 'rows': data}
+            self._dirty.add(view)
+
+    def save(self):
+        """Write every changed view to disk"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            snapshots = {view: dict(self.views[view]) for view in dirty}
+
+        os.makedirs(self.directory, exist_ok=True)
+        for view, entries in snapshots.items():
+            tmp_file = f"{self._view_file(view)}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_file, self._view_file(view))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Job journal for checkpointing and resuming scraping runs
+
+This module appends one JSON line per completed (author, view, page) unit,
+holding the rows that unit produced (typed records are stored as their
+record type and value lists). A resumed run replays journaled units
+from disk instead of fetching them again. Only file offsets are kept in
+memory, so replaying a large journal does not load every row at once.
+"""
+
+import json
+import os
+import threading
+from .config import config
+from .scrapers.records import dump_rows, load_rows
+
+
+class JobJournal:
+    """Durable record of completed (author, view, page) units and their rows"""
+
+    def __init__(self, path=None, resume=False):
+        self.path = path or str(config.get('journal.file', '.config/journal.jsonl'))
+        self.index = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume and os.path.exists(self.path):
+            self._load_index()
+            print(f"♻️ Resuming from journal: {len(self.index)} completed units")
+        else:
+            open(self.path, 'wb').close()
+
+        self.file = open(self.path, 'ab')
+
+    @classmethod
+    def from_config(cls):
+        """Open the journal configured in journal.*, or None if journaling is disabled"""
+        if not config.get('journal.enabled', True):
+            return None
+        return cls(resume=bool(config.get('journal.resume', False)))
+
+    @staticmethod
+    def _key(author_id, view, page):
+        return (str(author_id), view, int(page))
+
+    def _load_index(self):
+        with open(self.path, 'r+b') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("incomplete line")
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash; drop it so new units append cleanly
+                    f.truncate(offset)
+                    break
+                key = self._key(entry['author_id'], entry['view'], entry['page'])
+                self.index[key] = (offset, entry['total_pages'])
+
+    def get_total_pages(self, author_id, view):
+        """Get the page count recorded with page 1 of a view, or None"""
+        unit = self.index.get(self._key(author_id, view, 1))
+        return unit[1] if unit else None
+
+    def has(self, author_id, view, page):
+        """Check whether a unit is already complete"""
+        return self._key(author_id, view, page) in self.index
+
+    def get_rows(self, author_id, view, page):
+        """Read the rows a completed unit produced"""
+        offset, _ = self.index[self._key(author_id, view, page)]
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            entry = json.loads(f.readline())
+        return load_rows(entry.get('record'), entry['rows'])
+
+    def record(self, author_id, view, page, total_pages, rows):
+        """Record a completed unit and the rows it produced"""
+        record_name, data = dump_rows(rows)
+        entry = {
+            'author_id': str(author_id),
+            'view': view,
+            'page': page,
+            'total_pages': total_pages,
+            'rows': data
+        }
+        if record_name:
+            entry['record'] = record_name
+        line = json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n'
+
+        with self._lock:
+            offset = self.file.tell()
+            self.file.write(line)
+            self.file.flush()
+            self.index[self._key(author_id, view, page)] = (offset, total_pages)
+
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            if not self.file.closed:
+                self.file.close()
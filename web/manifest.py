@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Run manifests for the SINTA scraping application
+
+Every scrape_* call and scrape_all writes a JSON manifest next to its
+CSVs recording where the run's time went: wall time, requests, cache
+hits, retries, parse errors and rows per output category, and per
+author within each category. Request and parse counts are taken from
+the live metrics (web.metrics), attributed to categories by SINTA view,
+so they stay correct when author-major or pipeline mode scrapes several
+categories at once.
+
+Two manifests can be compared to spot regressions between runs:
+  python -m web.benchmark compare output-01102026/manifest-all-093000.json output-18102026/manifest-all-101500.json
+
+In author-major and pipeline mode every category is in progress for the
+whole call, so each category's seconds is that call's wall time.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from .config import config
+from .metrics import (CACHE_HITS, ITEM_PARSE_FAILURES, PARSE_SECONDS, PARSED_PAGES, REQUEST_SECONDS,
+                      REQUESTS, RESPONSE_BYTES, RETRIES)
+
+
+# Output category → the SINTA views its rows come from
+TARGET_VIEWS = {
+    'buku': ('books',),
+    'haki': ('iprs',),
+    'publikasi_scopus': ('scopus',),
+    'publikasi_gs': ('googlescholar',),
+    'publikasi_wos': ('wos',),
+    'penelitian': ('researches',),
+    'ppm': ('services',),
+    'profil': ('profile',)
+}
+
+# Counters kept per view, in manifest order
+COUNTERS = ['requests', 'failed_requests', 'cache_hits', 'retries', 'bytes',
+            'request_seconds', 'parsed_pages', 'parse_errors', 'item_failures', 'parse_seconds']
+
+# Settings recorded with every run, so runs with different tuning can be told apart
+SETTINGS = ['scraping.max_workers', 'scraping.page_workers', 'scraping.view_workers', 'scraping.parse_processes',
+            'scraping.request_delay', 'scraping.parser', 'scraping.targeted_parse', 'scraping.author_major',
+            'scraping.since', 'scraping.until', 'pipeline.enabled', 'pipeline.fetch_workers',
+            'pipeline.parse_workers', 'cache.enabled', 'cache.offline', 'journal.resume',
+            'incremental.enabled', 'planning.enabled']
+
+
+def view_counters():
+    """Snapshot the request and parse counters of every view as {view: {counter: value}}"""
+    views = {}
+
+    def add(view, counter, value):
+        views.setdefault(view, dict.fromkeys(COUNTERS, 0))[counter] += value
+
+    for (view, status), value in REQUESTS.samples().items():
+        add(view, 'requests', value)
+        if status != '200':
+            add(view, 'failed_requests', value)
+    for (view, _), value in RETRIES.samples().items():
+        add(view, 'retries', value)
+    for (view,), value in CACHE_HITS.samples().items():
+        add(view, 'cache_hits', value)
+    for (view,), value in RESPONSE_BYTES.samples().items():
+        add(view, 'bytes', value)
+    for (view,), (_, total, _) in REQUEST_SECONDS.samples().items():
+        add(view, 'request_seconds', total)
+    for (view, status), value in PARSED_PAGES.samples().items():
+        add(view, 'parsed_pages', value)
+        if status == 'error':
+            add(view, 'parse_errors', value)
+    for (view,), value in ITEM_PARSE_FAILURES.samples().items():
+        add(view, 'item_failures', value)
+    for (view,), (_, total, _) in PARSE_SECONDS.samples().items():
+        add(view, 'parse_seconds', total)
+    return views
+
+
+def counter_delta(before, after, views=None):
+    """Sum the counter increases between two snapshots over some views (default all)"""
+    totals = dict.fromkeys(COUNTERS, 0)
+    for view in (after if views is None else views):
+        start = before.get(view, {})
+        for counter, value in after.get(view, {}).items():
+            totals[counter] += value - start.get(counter, 0)
+    for counter in ('request_seconds', 'parse_seconds'):
+        totals[counter] = round(totals[counter], 3)
+    return totals
+
+
+class CategoryRun:
+    """Timings and counters of one output category within a run"""
+
+    def __init__(self, target):
+        self.target = target
+        self.views = TARGET_VIEWS.get(target, ())
+        self.seconds = 0.0
+        self.rows = 0
+        self.counters = {}
+        self.authors = {}
+        self._lock = threading.Lock()
+
+    def timed(self, scrape_author):
+        """Wrap scrape_author(author_id, author_name) to record each author's time and rows"""
+        def scrape(author_id, author_name):
+            started = time.perf_counter()
+            rows = scrape_author(author_id, author_name)
+            self.record_author(author_id, author_name, time.perf_counter() - started, len(rows))
+            return rows
+        return scrape
+
+    def record_author(self, author_id, author_name, seconds, rows):
+        with self._lock:
+            self.authors[str(author_id)] = {'name': author_name, 'seconds': round(seconds, 3), 'rows': rows}
+
+    def to_dict(self):
+        return {
+            'seconds': round(self.seconds, 3),
+            'rows': self.rows,
+            **self.counters,
+            'authors': self.authors
+        }
+
+
+class RunManifest:
+    """Performance record of one scrape call"""
+
+    def __init__(self, name, lecturers=0):
+        self.name = name
+        self.lecturers = lecturers
+        self.mode = None
+        self.started_at = datetime.now()
+        self.finished_at = None
+        self.status = 'running'
+        self.categories = {}
+        self._started = time.perf_counter()
+        self._before = view_counters()
+        self.seconds = 0.0
+        self.totals = {}
+
+    @property
+    def filename(self):
+        return f"manifest-{self.name}-{self.started_at.strftime('%H%M%S')}.json"
+
+    @contextmanager
+    def category(self, target):
+        """Time a category and attribute the counters of its views to it"""
+        category = self.categories.setdefault(target, CategoryRun(target))
+        before = view_counters()
+        started = time.perf_counter()
+        try:
+            yield category
+        finally:
+            category.seconds += time.perf_counter() - started
+            delta = counter_delta(before, view_counters(), category.views)
+            for counter, value in delta.items():
+                category.counters[counter] = round(category.counters.get(counter, 0) + value, 3)
+
+    def finish(self, status='completed'):
+        self.finished_at = datetime.now()
+        self.status = status
+        self.seconds = time.perf_counter() - self._started
+        self.totals = counter_delta(self._before, view_counters())
+        self.totals['rows'] = sum(category.rows for category in self.categories.values())
+
+    def to_dict(self):
+        return {
+            'run': self.name,
+            'status': self.status,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': self.finished_at.isoformat(timespec='seconds') if self.finished_at else None,
+            'seconds': round(self.seconds, 3),
+            'lecturers': self.lecturers,
+            'settings': {'mode': self.mode, **{key: config.get(key) for key in SETTINGS}},
+            'totals': self.totals,
+            'categories': {target: category.to_dict() for target, category in self.categories.items()}
+        }
+
+    def save(self, path):
+        """Write the manifest as JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+
+def load_manifest(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _change(old, new):
+    if not old:
+        return None if not new else float('inf')
+    return (new - old) / old
+
+
+def compare_manifests(old, new, threshold=0.1):
+    """Compare two manifests category by category
+
+    Returns a list of (category, metric, old, new, change, regression)
+    rows, where change is the relative change and regression flags a
+    rise in time, requests, retries or errors by more than threshold.
+    """
+    rows = []
+    watched = ['seconds', 'rows', 'requests', 'cache_hits', 'retries', 'failed_requests',
+               'parse_errors', 'item_failures', 'parse_seconds']
+    worse_when_higher = {'seconds', 'requests', 'retries', 'failed_requests', 'parse_errors',
+                         'item_failures', 'parse_seconds'}
+
+    sections = [('(total)', {'seconds': old.get('seconds', 0), **old.get('totals', {})},
+                 {'seconds': new.get('seconds', 0), **new.get('totals', {})})]
+    for target in list(old.get('categories', {})) + [t for t in new.get('categories', {}) if t not in old.get('categories', {})]:
+        sections.append((target, old.get('categories', {}).get(target, {}), new.get('categories', {}).get(target, {})))
+
+    for target, before, after in sections:
+        for metric in watched:
+            if metric not in before and metric not in after:
+                continue
+            old_value, new_value = before.get(metric, 0), after.get(metric, 0)
+            change = _change(old_value, new_value)
+            regression = (metric in worse_when_higher and change is not None and change > threshold)
+            rows.append((target, metric, old_value, new_value, change, regression))
+    return rows
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Live metrics for the SINTA scraping application
+
+This module keeps process-wide counters and histograms for the request
+and parse layers, labelled by SINTA view and status, and renders them in
+the Prometheus text exposition format served at /metrics by the web app.
+It is a minimal stand-in for prometheus_client: every update is one
+dict lookup and an addition under a per-metric lock, cheap enough for
+the fetch and parse hot paths.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from urllib.parse import parse_qs, urlparse
+
+
+_PROFILE_PATH = re.compile(r'/authors/profile/\d+')
+
+
+def url_view(url):
+    """Get the SINTA view a URL belongs to, for labelling its requests"""
+    parsed = urlparse(url)
+    if _PROFILE_PATH.search(parsed.path):
+        return parse_qs(parsed.query).get('view', ['profile'])[0]
+    if 'login' in parsed.path:
+        return 'login'
+    return 'other'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in list(zip(names, values)) + list(extra)]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """A named family of labelled samples"""
+
+    kind = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def samples(self):
+        """Copy of every sample as {label values: value}"""
+        with self._lock:
+            return {key: self._copy(value) for key, value in self._values.items()}
+
+    def _copy(self, value):
+        return value
+
+    def clear(self):
+        """Drop every sample"""
+        with self._lock:
+            self._values.clear()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+
+    def _render_samples(self, items):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def total(self):
+        """Sum over every label combination"""
+        with self._lock:
+            return sum(self._values.values())
+
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Distribution of observations over fixed buckets"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=()):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _copy(self, value):
+        """A histogram sample is (bucket counts, sum, count)"""
+        counts, total, count = value
+        return list(counts), total, count
+
+    def _render_samples(self, items):
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(float(bound)))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=()):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUESTS = registry.counter(
+    'sinta_requests_total', 'HTTP requests sent to SINTA, one per attempt', ['view', 'status'])
+REQUEST_SECONDS = registry.histogram(
+    'sinta_request_seconds', 'SINTA response time per attempt', ['view'],
+    [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30])
+RESPONSE_BYTES = registry.counter(
+    'sinta_response_bytes_total', 'Bytes downloaded from SINTA', ['view'])
+RETRIES = registry.counter(
+    'sinta_retries_total', 'Requests retried after a transient failure', ['view', 'reason'])
+CACHE_HITS = registry.counter(
+    'sinta_cache_hits_total', 'Pages served from the on-disk response cache', ['view'])
+PARSE_SECONDS = registry.histogram(
+    'sinta_parse_seconds', 'Time to parse one page', ['view'],
+    [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5])
+PARSED_PAGES = registry.counter(
+    'sinta_parsed_pages_total', 'Pages parsed', ['view', 'status'])
+PARSED_ITEMS = registry.counter(
+    'sinta_parsed_items_total', 'Items parsed from list pages', ['view'])
+ITEM_PARSE_FAILURES = registry.counter(
+    'sinta_item_parse_failures_total', 'List items skipped because they failed to parse', ['view'])
+ROWS_WRITTEN = registry.counter(
+    'sinta_rows_written_total', 'Rows written to CSV outputs', ['output'])
+
+
+def record_request(view, status, seconds, size=0):
+    """Count one request attempt"""
+    REQUESTS.inc(view=view, status=status)
+    REQUEST_SECONDS.observe(seconds, view=view)
+    if size:
+        RESPONSE_BYTES.inc(size, view=view)
+
+
+def record_parse(view, seconds, rows):
+    """Count one parsed page; rows is None if the page failed to parse"""
+    PARSE_SECONDS.observe(seconds, view=view)
+    PARSED_PAGES.inc(view=view, status='error' if rows is None else 'ok')
+    if rows:
+        PARSED_ITEMS.inc(len(rows), view=view)
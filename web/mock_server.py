@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the SINTA site
+
+This module serves SINTA-shaped pages from a local HTTP server so
+concurrency and rate-limit settings can be tuned without touching the
+real site. It implements the login flow SintaRequestLogin.login walks
+through (a login page with a CSRF token, a form post that sets a session
+cookie and redirects to /authors) and author profile pages with every
+list view. List pages are synthetic, generated deterministically per
+author, view and page, or are recorded fixtures (see --record-fixtures)
+with their pagination rewritten. Page counts, items per page, response
+latency and the rate of injected 503 errors are configurable.
+
+Usage:
+  python -m web.mock_server --port 8808 --pages 5 --latency 0.05 --error-rate 0.02
+
+Point the scraper at it with session.base_url, e.g. in Python:
+  config.set('session.base_url', 'http://127.0.0.1:8808')
+"""
+
+import argparse
+import html
+import json
+import random
+import re
+import secrets
+import socket
+import sys
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+
+LIST_VIEWS = ['books', 'iprs', 'researches', 'services', 'scopus', 'googlescholar', 'wos']
+
+# Views whose pagination line carries a '|' separator, like the live site
+PUBLICATION_VIEWS = {'scopus', 'googlescholar', 'wos'}
+
+SESSION_COOKIE = 'sinta_session'
+
+_PROFILE_PATH = re.compile(r'^/authors/profile/(\d+)$')
+_PAGINATION = re.compile(r'Page\s+\d+\s+of\s+\d+(\s*\|?\s*)Total Records\s*:\s*\d+')
+
+_FIRST_NAMES = ['Andi', 'Budi', 'Citra', 'Dewi', 'Eko', 'Fitri', 'Gilang', 'Hana', 'Indra', 'Joko',
+                'Kartika', 'Lestari', 'Maya', 'Nanda', 'Putri', 'Rizky', 'Sari', 'Teguh', 'Wahyu', 'Yuni']
+_LAST_NAMES = ['Pratama', 'Saputra', 'Wijaya', 'Hidayat', 'Nugroho', 'Kusuma', 'Santoso', 'Lestari',
+               'Siregar', 'Nasution', 'Putra', 'Rahmawati', 'Setiawan', 'Gunawan']
+_WORDS = ['Analisis', 'Sistem', 'Informasi', 'Implementasi', 'Metode', 'Jaringan', 'Saraf', 'Tiruan',
+          'Klasifikasi', 'Data', 'Mining', 'Berbasis', 'Web', 'Pengembangan', 'Aplikasi', 'Mobile',
+          'Evaluasi', 'Kinerja', 'Model', 'Prediksi', 'Deep', 'Learning', 'Optimasi', 'Algoritma',
+          'Genetika', 'Keamanan', 'Cloud', 'Computing', 'Pembelajaran', 'Mesin', 'Studi', 'Kasus']
+_JOURNALS = ['Jurnal Teknologi Informasi dan Ilmu Komputer', 'Jurnal Sistem Informasi', 'IEEE Access',
+             'Procedia Computer Science', 'Journal of Physics: Conference Series', 'Jurnal RESTI']
+_PUBLISHERS = ['Deepublish', 'Penerbit Andi', 'Graha Ilmu', 'UB Press', 'Informatika Bandung']
+_CITIES = ['Yogyakarta', 'Malang', 'Bandung', 'Jakarta', 'Surabaya', 'Semarang']
+
+
+def _escape(value):
+    return html.escape(value, quote=True)
+
+
+class SyntheticPages:
+    """Deterministic SINTA-shaped pages for any author"""
+
+    def __init__(self, items_per_page=10):
+        self.items_per_page = items_per_page
+
+    def _person(self, rng):
+        return f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+
+    def _title(self, rng):
+        return ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(6, 14)))
+
+    def _book(self, rng, year):
+        authors = ''.join(f'<a href="#!">{_escape(self._person(rng))}</a>' for _ in range(rng.randint(1, 4)))
+        return (f'<div class="ar-list-item mb-5"><div class="ar-title">{_escape(self._title(rng))}</div>'
+                f'<div class="ar-meta"><a href="#!">Category : {rng.choice(["Buku Ajar", "Monograf", "Referensi"])}</a></div>'
+                f'<div class="ar-meta"><a href="#!"><i class="zmdi zmdi-account"></i> Authors</a>{authors}</div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-pub">{rng.choice(_PUBLISHERS)}</a>'
+                f'<a href="#!" class="ar-year">{year}</a><a href="#!" class="ar-cited">{rng.choice(_CITIES)}</a>'
+                f'<a href="#!" class="ar-quartile">ISBN : 978-623-{rng.randint(100, 999)}-{rng.randint(100, 999)}-{rng.randint(0, 9)}</a></div></div>\n')
+
+    def _ipr(self, rng, year):
+        inventors = ', '.join(self._person(rng) for _ in range(rng.randint(1, 3)))
+        return (f'<div class="ar-list-item mb-5"><div class="ar-title">{_escape(self._title(rng))}</div>'
+                f'<div class="ar-meta"><a href="#!">Inventor : {_escape(inventors)}</a></div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-quartile">{rng.choice(["Hak Cipta", "Paten Sederhana", "Desain Industri"])}</a>'
+                f'<a href="#!" class="ar-cited">Nomor : EC{year}{rng.randint(10000, 99999)}</a>'
+                f'<a href="#!" class="ar-year">{year}</a></div></div>\n')
+
+    def _funded(self, rng, year):
+        members = ''.join(
+            f'<a href="/authors/profile/{rng.randint(5000000, 6999999)}">{_escape(self._person(rng))}</a>'
+            for _ in range(rng.randint(1, 4))
+        )
+        return (f'<div class="ar-list-item mb-5"><div class="ar-title">{_escape(self._title(rng))}\n</div>'
+                f'<div class="ar-meta"><a href="#!">Leader : {_escape(self._person(rng))}</a>'
+                f'<a href="#!" class="ar-pub">{rng.choice(["PENELITIAN DASAR", "PENELITIAN TERAPAN", "PKM", "Hibah Internal"])}</a></div>'
+                f'<div class="ar-meta">{members}</div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-year">{year}</a>'
+                f'<a href="#!" class="ar-quartile">Rp. {rng.randint(5, 150)}.000.000</a>'
+                f'<a href="#!" class="ar-quartile">{rng.choice(["Approved", "Completed"])}</a>'
+                f'<a href="#!" class="ar-quartile">{rng.choice(["BIMA", "SIMLITABMAS", "Internal"])}</a></div></div>\n')
+
+    def _scopus(self, rng, year):
+        return (f'<div class="ar-list-item mb-5"><div class="ar-title">'
+                f'<a href="https://www.scopus.com/record/display.uri?eid=2-s2.0-{rng.randint(10**10, 10**11)}">{_escape(self._title(rng))}</a></div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-quartile">Q{rng.randint(1, 4)}</a>'
+                f'<a href="https://www.scopus.com/sourceid/{rng.randint(10**4, 10**6)}" class="ar-pub">{_escape(rng.choice(_JOURNALS))}</a>'
+                f'<span><a href="#!">Creator : {_escape(self._person(rng))}</a></span></div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-year"><i class="zmdi zmdi-calendar"></i> {year}</a>'
+                f'<a href="#!" class="ar-cited">{rng.randint(0, 90)}</a></div></div>\n')
+
+    def _googlescholar(self, rng, year):
+        authors = ', '.join(self._person(rng) for _ in range(rng.randint(1, 5)))
+        return (f'<div class="ar-list-item mb-5"><div class="ar-title">'
+                f'<a href="https://scholar.google.com/scholar?cluster={rng.randint(10**15, 10**16)}">{_escape(self._title(rng))}</a></div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-pub">{_escape(rng.choice(_JOURNALS))}, {rng.randint(1, 12)}({rng.randint(1, 4)}), {rng.randint(1, 300)}</a></div>'
+                f'<div class="ar-meta"><a href="#!">Authors : {_escape(authors)}</a></div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-year"><i class="zmdi zmdi-calendar"></i> {year}</a>'
+                f'<a href="#!" class="ar-cited">{rng.randint(0, 200)} cited</a></div></div>\n')
+
+    def _wos(self, rng, year):
+        total = rng.randint(1, 8)
+        authors = ', '.join(self._person(rng) for _ in range(total))
+        indexed = '<span class="scopus-indexed">Scopus</span>' if rng.random() < 0.6 else ''
+        return (f'<div class="ar-list-item mb-5"><div class="ar-title">'
+                f'<a href="https://www.webofscience.com/wos/woscc/full-record/WOS:{rng.randint(10**14, 10**15)}">{_escape(self._title(rng))}</a></div>'
+                f'<div class="ar-meta"><a href="#!" class="ar-pub">{rng.choice(["Science Citation Index Expanded", "Emerging Sources Citation Index"])}</a>'
+                f'<a href="#!" class="ar-quartile">Q{rng.randint(1, 4)}</a><a href="#!">Authors : {_escape(authors)}</a>'
+                f'<a href="https://www.webofscience.com/wos/woscc/source/{rng.randint(1000, 9999)}" class="ar-pub">{_escape(rng.choice(_JOURNALS))}</a></div>'
+                f'<div class="ar-meta"><a href="#!">Author Order : {rng.randint(1, total)} of {total}</a>'
+                f'<a href="#!" class="ar-year"><i class="zmdi zmdi-calendar"></i> {year}</a>'
+                f'<a href="#!" class="ar-cited">{rng.randint(0, 60)} cited</a>{indexed}'
+                f'<a href="#!" class="ar-sinta">DOI: 10.{rng.randint(1000, 9999)}/j.{rng.randint(10000, 99999)}</a></div></div>\n')
+
+    def author_name(self, author_id):
+        """Get the synthetic name of an author"""
+        return self._person(random.Random(f"name-{author_id}"))
+
+    def list_page(self, author_id, view, page, total_pages):
+        """Render one page of a list view, newest items first"""
+        rng = random.Random(f"{author_id}-{view}-{page}")
+        make_item = {
+            'books': self._book,
+            'iprs': self._ipr,
+            'researches': self._funded,
+            'services': self._funded,
+            'scopus': self._scopus,
+            'googlescholar': self._googlescholar,
+            'wos': self._wos
+        }[view]
+        base_year = 2024 - (page - 1) * 2
+        years = sorted((base_year - rng.randint(0, 1) for _ in range(self.items_per_page)), reverse=True)
+        items = ''.join(make_item(rng, year) for year in years)
+        separator = ' | ' if view in PUBLICATION_VIEWS else ' '
+        pagination = (f'<div class="pagination-text">Page {page} of {total_pages}{separator}'
+                      f'Total Records : {total_pages * self.items_per_page}</div>')
+        return items + pagination
+
+    def profile_page(self, author_id, counts):
+        """Render an author's profile summary with per-view article counts"""
+        rng = random.Random(f"profile-{author_id}")
+        article = {'Scopus': counts.get('scopus', 0), 'GScholar': counts.get('googlescholar', 0), 'WOS': counts.get('wos', 0)}
+        rows = []
+        for metric in ["Article", "Citation", "Cited Document", "H-Index", "i10-Index", "G-Index"]:
+            cells = ''.join(
+                f'<td>{article[source] if metric == "Article" else rng.randint(0, 300)}</td>'
+                for source in article
+            )
+            rows.append(f'<tr><td>{metric}</td>{cells}</tr>')
+        return (f'<div class="row"><div class="col-lg col-md"><h3><a href="/authors/profile/{author_id}">{_escape(self.author_name(author_id))}</a></h3>'
+                f'<div class="meta-profile"><a href="/affiliations/profile/404">Universitas Mock</a> '
+                f'<a href="/departments/profile/404/55201">S1 - Teknik Informatika</a></div></div></div>'
+                f'<div class="row no-gutters"><div class="col"><div class="pr-num">{rng.randint(100, 3000)}</div><div class="pr-txt">SINTA Score Overall</div></div>'
+                f'<div class="col"><div class="pr-num">{rng.randint(10, 900)}</div><div class="pr-txt">SINTA Score 3Yr</div></div></div>'
+                f'<table class="table stat-table"><thead><tr><th></th><th>Scopus</th><th>GScholar</th><th>WOS</th></tr></thead>'
+                f'<tbody>{"".join(rows)}</tbody></table>')
+
+
+class RecordedPages:
+    """Pages replayed from a fixture directory, with pagination rewritten to the requested counts"""
+
+    def __init__(self, directory):
+        self.pages = {}
+        for path in sorted(Path(directory).glob('*.html')):
+            view = re.split(r'[_\-.]', path.name, maxsplit=1)[0]
+            self.pages.setdefault(view, []).append(path.read_text(encoding='utf-8', errors='replace'))
+        if not self.pages:
+            raise ValueError(f"No recorded pages in {directory}")
+
+    def list_page(self, author_id, view, page, total_pages):
+        recorded = self.pages.get(view)
+        if not recorded:
+            return ''
+        body = recorded[(page - 1) % len(recorded)]
+        return _PAGINATION.sub(
+            lambda match: f"Page {page} of {total_pages}{match.group(1)}Total Records : {total_pages * 10}",
+            body
+        )
+
+    def profile_page(self, author_id, counts):
+        recorded = self.pages.get('profile')
+        return recorded[0] if recorded else ''
+
+
+class MockSinta:
+    """Content, login state and fault injection of the stand-in site"""
+
+    def __init__(self, pages=3, items_per_page=10, view_pages=None, latency=0.0, jitter=0.0,
+                 error_rate=0.0, username='mock', password='mock', fixtures=None, seed=None):
+        self.pages = max(1, int(pages))
+        self.view_pages = {view: int(count) for view, count in (view_pages or {}).items()}
+        self.items_per_page = items_per_page
+        self.latency = float(latency)
+        self.jitter = float(jitter)
+        self.error_rate = float(error_rate)
+        self.username = username
+        self.password = password
+        self.source = RecordedPages(fixtures) if fixtures else SyntheticPages(items_per_page)
+        self.recorded = fixtures is not None
+        self.csrf_token = secrets.token_hex(20)
+        self.sessions = set()
+        self.stats = {'requests': 0, 'pages': 0, 'errors': 0, 'logins': 0, 'bytes': 0}
+        self.page_requests = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._render = lru_cache(maxsize=4096)(self._render_page)
+
+    def total_pages(self, view):
+        """Number of pages of a view, for every author"""
+        return max(0, self.view_pages.get(view, self.pages))
+
+    def count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def count_page_request(self, path):
+        """Count a request for a profile or list page, by path and query"""
+        with self._lock:
+            self.page_requests[path] = self.page_requests.get(path, 0) + 1
+
+    def wait(self):
+        """Simulate server latency"""
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def should_fail(self):
+        """Decide whether to inject an error into this response"""
+        with self._lock:
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def _render_page(self, author_id, view, page):
+        if view is None:
+            counts = {name: self.total_pages(name) * self.items_per_page for name in LIST_VIEWS}
+            body = self.source.profile_page(author_id, counts)
+            title = self.source.author_name(author_id) if not self.recorded else 'Profile'
+        else:
+            total_pages = max(1, self.total_pages(view))
+            body = self.source.list_page(author_id, view, min(page, total_pages), total_pages)
+            title = view
+        if self.recorded:
+            return body.encode('utf-8')
+        return _chrome(title, body).encode('utf-8')
+
+    def render(self, author_id, view, page):
+        """Get the HTML of a profile page (view None) or one page of a list view"""
+        return self._render(author_id, view, page)
+
+    def login_page(self, error=False):
+        alert = '<div class="alert alert-danger">Username atau password salah</div>' if error else ''
+        body = (f'{alert}<form action="/logins/do" method="post">'
+                f'<input type="hidden" name="_token" value="{self.csrf_token}">'
+                f'<input type="text" name="username"><input type="password" name="password">'
+                f'<button type="submit">Login</button></form>')
+        return _chrome('Login', body, head=f'<meta name="csrf-token" content="{self.csrf_token}">').encode('utf-8')
+
+    def login(self, form):
+        """Check posted credentials, returning a new session id or None"""
+        fields = {name: values[0] for name, values in form.items()}
+        if fields.get('_token') != self.csrf_token:
+            return None
+        if fields.get('username') != self.username or fields.get('password') != self.password:
+            return None
+        session_id = secrets.token_hex(16)
+        with self._lock:
+            self.sessions.add(session_id)
+            self.stats['logins'] += 1
+        return session_id
+
+    def is_logged_in(self, cookie_header):
+        """Whether a Cookie header carries a session this server issued"""
+        for part in (cookie_header or '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == SESSION_COOKIE:
+                with self._lock:
+                    return value in self.sessions
+        return False
+
+
+def _chrome(title, body, head=''):
+    """Wrap a page body in the navigation, footer and chart scripts of a SINTA page"""
+    nav = ''.join(
+        f'<li class="nav-item"><a class="nav-link" href="/{section}">{section.title()}</a></li>'
+        for section in ['home', 'authors', 'affiliations', 'journals', 'subjects', 'about'] * 4
+    )
+    charts = ';'.join(
+        f'var chart{i}=new Chart(document.getElementById("c{i}"),{{"type":"bar","data":{{"labels":[{",".join(str(year) for year in range(2010, 2025))}]}}}})'
+        for i in range(6)
+    )
+    return (f'<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">{head}<title>{_escape(title)} - SINTA</title></head>'
+            f'<body><header class="header"><nav class="navbar"><ul class="navbar-nav">{nav}</ul></nav></header>'
+            f'<div class="content"><div class="container">{body}</div></div>'
+            f'<footer class="footer"><p>SINTA - Science and Technology Index</p>{nav}</footer>'
+            f'<script>{charts}</script></body></html>\n')
+
+
+class MockSintaHandler(BaseHTTPRequestHandler):
+    """HTTP handler serving a MockSinta site"""
+
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def site(self):
+        return self.server.site
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; don't let Nagle hold the body back
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b'', content_type='text/html; charset=utf-8', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+        self.site.count('bytes', len(body))
+
+    def _redirect(self, location, headers=None):
+        self._send(302, headers={'Location': location, **(headers or {})})
+
+    def do_GET(self):
+        self.site.count('requests')
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == '/__stats':
+            with self.site._lock:
+                stats = dict(self.site.stats, page_requests=dict(self.site.page_requests))
+            self._send(200, json.dumps(stats).encode('utf-8'), 'application/json')
+            return
+        if url.path == '/logins':
+            self._send(200, self.site.login_page(error='error' in query))
+            return
+        if not self.site.is_logged_in(self.headers.get('Cookie')):
+            self._redirect('/logins')
+            return
+        if url.path == '/authors':
+            self._send(200, _chrome('Authors', '<h1>Authors</h1>').encode('utf-8'))
+            return
+
+        match = _PROFILE_PATH.match(url.path)
+        view = query.get('view', [None])[0]
+        if match is None or (view is not None and view not in LIST_VIEWS):
+            self._send(404, b'<h1>Not Found</h1>')
+            return
+
+        self.site.count_page_request(self.path)
+        self.site.wait()
+        if self.site.should_fail():
+            self.site.count('errors')
+            self._send(503, b'<h1>Service Unavailable</h1>')
+            return
+        try:
+            page = max(1, int(query.get('page', ['1'])[0]))
+        except ValueError:
+            page = 1
+        self.site.count('pages')
+        self._send(200, self.site.render(int(match.group(1)), view, page))
+
+    def do_POST(self):
+        self.site.count('requests')
+        url = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8', errors='replace'))
+
+        if url.path != '/logins/do':
+            self._send(404, b'<h1>Not Found</h1>')
+            return
+        session_id = self.site.login(form)
+        if session_id is None:
+            self._redirect('/logins?error=1')
+            return
+        self._redirect('/authors', {'Set-Cookie': f'{SESSION_COOKIE}={session_id}; Path=/; HttpOnly'})
+
+
+class MockSintaServer(ThreadingHTTPServer):
+    """Threaded HTTP server for a MockSinta site"""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, site, host='127.0.0.1', port=0, verbose=False):
+        self.site = site
+        self.verbose = verbose
+        super().__init__((host, port), MockSintaHandler)
+
+    @property
+    def url(self):
+        """Base URL to use as session.base_url"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread, returning the thread"""
+        thread = threading.Thread(target=self.serve_forever, name='mock-sinta', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.shutdown()
+        self.server_close()
+
+
+def parse_view_pages(values):
+    """Parse VIEW=PAGES overrides"""
+    view_pages = {}
+    for value in values or []:
+        view, _, pages = value.partition('=')
+        if view not in LIST_VIEWS or not pages.isdigit():
+            raise argparse.ArgumentTypeError(f"Expected VIEW=PAGES with VIEW one of {', '.join(LIST_VIEWS)}: {value}")
+        view_pages[view] = int(pages)
+    return view_pages
+
+
+def add_site_arguments(parser):
+    """Add the MockSinta site options to an argument parser"""
+    parser.add_argument('--pages', type=int, default=3, help='Pages per list view (default: 3)')
+    parser.add_argument('--view-pages', action='append', metavar='VIEW=PAGES', help='Override the page count of one view (repeatable)')
+    parser.add_argument('--items', type=int, default=10, help='Items per page (default: 10)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every page response (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random extra latency of up to this many seconds (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of page responses answered with HTTP 503 (default: 0)')
+    parser.add_argument('--fixtures', help='Serve recorded pages from this directory instead of synthetic ones')
+    parser.add_argument('--username', default='mock', help='Accepted login username (default: mock)')
+    parser.add_argument('--password', default='mock', help='Accepted login password (default: mock)')
+
+
+def site_from_args(args):
+    """Create a MockSinta site from parsed add_site_arguments options"""
+    return MockSinta(
+        pages=args.pages,
+        items_per_page=args.items,
+        view_pages=parse_view_pages(args.view_pages),
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        username=args.username,
+        password=args.password,
+        fixtures=args.fixtures
+    )
+
+
+def create_argument_parser():
+    """Create command line argument parser"""
+    parser = argparse.ArgumentParser(description='Local stand-in server for the SINTA site')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8808, help='Port to listen on (default: 8808, 0 = any free port)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    add_site_arguments(parser)
+    return parser
+
+
+def main(argv=None):
+    """Run the mock server until interrupted"""
+    args = create_argument_parser().parse_args(argv)
+    server = MockSintaServer(site_from_args(args), args.host, args.port, args.verbose)
+    print(f"🧪 Mock SINTA listening on {server.url} (login: {args.username}/{args.password})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Mock SINTA stopped")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
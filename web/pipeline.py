@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Staged fetch → parse → write pipeline for the SINTA scraping application
+
+This module runs list-view scraping as three stages joined by bounded
+queues: fetch workers download raw pages, parse workers turn them into
+rows with the scrapers' own page parsers, and a single writer streams
+rows into the CSV sinks in roster and page order. A slow disk or a slow
+parser fills the queue in front of it and holds the stages upstream
+back instead of piling pages up in memory, and fetchers may not start a
+view more than a fixed window ahead of the writer.
+"""
+
+import threading
+import time
+from queue import Queue
+from .config import config
+
+
+# Tells a parse worker or the writer that its upstream stage has finished
+_DONE = object()
+
+
+class StageStats:
+    """Item count and busy time of one pipeline stage"""
+
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, started):
+        """Record one item that started processing at the given perf_counter time"""
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.items += 1
+            self.busy_seconds += elapsed
+
+    def to_dict(self):
+        with self._lock:
+            return {'workers': self.workers, 'items': self.items, 'busy_seconds': round(self.busy_seconds, 3)}
+
+
+class MeteredQueue(Queue):
+    """Bounded queue that tracks its peak depth"""
+
+    def __init__(self, name, maxsize):
+        super().__init__(maxsize)
+        self.name = name
+        self.max_depth = 0
+
+    def _put(self, item):
+        super()._put(item)
+        self.max_depth = max(self.max_depth, len(self.queue))
+
+    def to_dict(self):
+        return {'depth': self.qsize(), 'max_depth': self.max_depth, 'capacity': self.maxsize}
+
+
+class ScrapePipeline:
+    """Scrape list views for every lecturer through fetch, parse and write stages
+
+    views maps each output to (scraper, view, parse_func); sinks maps the
+    same outputs to open CSV sinks. Views are scraped output by output,
+    lecturer by lecturer, which is also the order rows are written in.
+    """
+
+    def __init__(self, views, sinks, lecturers, author_directory=None,
+                 fetch_workers=None, parse_workers=None, queue_size=None, window=None):
+        self.views = views
+        self.sinks = sinks
+        self.lecturers = lecturers
+        self.author_directory = author_directory
+        self.fetch_workers = max(1, int(fetch_workers or config.get('pipeline.fetch_workers', 4)))
+        self.parse_workers = max(1, int(parse_workers or config.get('pipeline.parse_workers', 2)))
+        queue_size = max(1, int(queue_size or config.get('pipeline.queue_size', 32)))
+        self.window = max(1, int(window or config.get('pipeline.window', 8)))
+
+        self.jobs = [(target, author_index) for target in views for author_index in range(len(lecturers))]
+        self.parse_queue = MeteredQueue('parse', queue_size)
+        self.write_queue = MeteredQueue('write', queue_size)
+        self.stats = {
+            'fetch': StageStats('fetch', self.fetch_workers),
+            'parse': StageStats('parse', self.parse_workers),
+            'write': StageStats('write', 1)
+        }
+
+        self._next_job = 0
+        self._jobs_written = 0
+        self._lock = threading.Lock()
+        self._window_open = threading.Condition(self._lock)
+
+    def metrics(self):
+        """Snapshot of per-stage counters and queue depths"""
+        return {
+            'stages': {name: stats.to_dict() for name, stats in self.stats.items()},
+            'queues': {queue.name: queue.to_dict() for queue in (self.parse_queue, self.write_queue)}
+        }
+
+    def _take_job(self):
+        """Claim the next view to fetch, waiting while it is too far ahead of the writer"""
+        with self._window_open:
+            if self._next_job >= len(self.jobs):
+                return None
+            job = self._next_job
+            self._next_job += 1
+            while job >= self._jobs_written + self.window:
+                self._window_open.wait()
+            return job
+
+    def _get_author(self, author_index):
+        author_id, author_name = self.lecturers[author_index]
+        if author_name is None and self.author_directory is not None:
+            author_name = self.author_directory.get_name(author_id)
+        return author_id, author_name
+
+    def _fetch_worker(self):
+        """Fetch stage: download every page of each claimed view into the parse queue"""
+        while True:
+            job = self._take_job()
+            if job is None:
+                return
+            target, author_index = self.jobs[job]
+            author_id, author_name = self.lecturers[author_index]
+            # Pages of this job already handed on, and its page count once known
+            progress = {'next_page': 1, 'total_pages': None}
+            try:
+                self._fetch_job(job, progress)
+            except Exception as e:
+                # The writer waits for every page of the job, so fill the rest with empty pages
+                print(f"   ❌ Failed to fetch {target} for ID {author_id}: {e}")
+                total_pages = progress['total_pages'] or 1
+                for page in range(progress['next_page'], total_pages + 1):
+                    self.parse_queue.put((job, author_id, author_name, page, total_pages, None, []))
+
+    def _fetch_job(self, job, progress):
+        """Fetch every page of one view, recording in progress how far it got"""
+        target, author_index = self.jobs[job]
+        scraper, view, _ = self.views[target]
+        author_id, author_name = self._get_author(author_index)
+        journal = scraper.journal
+
+        def put(page, total_pages, content, rows):
+            self.parse_queue.put((job, author_id, author_name, page, total_pages, content, rows))
+            progress['next_page'], progress['total_pages'] = page + 1, total_pages
+
+        if scraper.view_planner is not None and scraper.view_planner.is_empty(author_id, view):
+            # Still hand the writer an empty page so it can move past this view
+            put(1, 1, None, [])
+            return
+
+        total_pages = journal.get_total_pages(author_id, view) if journal else None
+        first_page = 1
+        if total_pages is None:
+            started = time.perf_counter()
+            content = scraper.fetch_view_page(author_id, view, 1)
+            total_pages = scraper.probe_total_pages(content) if content is not None else 1
+            self.stats['fetch'].add(started)
+            if total_pages is None:
+                # Without a page count the view cannot be paged; hand on page 1 as failed so nothing is journaled
+                print(f"   ⚠️ Page count of {view} for ID {author_id} unknown; skipping the rest of the view")
+                total_pages, content = 1, None
+            put(1, total_pages, content, None)
+            first_page = 2
+        progress['total_pages'] = total_pages
+
+        for page in range(first_page, total_pages + 1):
+            if journal and journal.has(author_id, view, page):
+                put(page, total_pages, None, journal.get_rows(author_id, view, page))
+                continue
+            started = time.perf_counter()
+            content = scraper.fetch_view_page(author_id, view, page)
+            self.stats['fetch'].add(started)
+            put(page, total_pages, content, None)
+
+    def _parse_worker(self):
+        """Parse stage: turn raw pages into rows, recording them in the journal"""
+        while True:
+            item = self.parse_queue.get()
+            if item is _DONE:
+                return
+            job, author_id, author_name, page, total_pages, content, rows = item
+            target, _ = self.jobs[job]
+            scraper, view, parse_func = self.views[target]
+            # A page that failed to fetch has no content, so it is neither parsed nor journaled
+            if rows is None and content is not None:
+                started = time.perf_counter()
+                try:
+                    _, rows = scraper.submit_parse(parse_func, content, author_id, author_name, page)()
+                except Exception as e:
+                    # The writer waits for every page, so a failed page still goes downstream
+                    print(f"   ⚠️ Error parsing page {page} for {author_name}: {e}")
+                    rows = None
+                if rows is not None and scraper.journal:
+                    try:
+                        scraper.journal.record(author_id, view, page, total_pages, rows)
+                    except OSError as e:
+                        print(f"   ⚠️ Could not journal page {page} for {author_name}: {e}")
+                self.stats['parse'].add(started)
+            rows = rows or []
+            if scraper.year_range is not None:
+                rows = scraper.year_range.filter(rows)
+            self.write_queue.put((job, author_name, page, total_pages, rows))
+
+    def _run_stage(self, worker, count, name):
+        threads = [
+            threading.Thread(target=worker, name=f'sinta-{name}-{i}', daemon=True)
+            for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _close_stage(self, threads, queue, count):
+        """Tell the next stage it has all its input once these workers finish"""
+        for thread in threads:
+            thread.join()
+        for _ in range(count):
+            queue.put(_DONE)
+
+    def run(self):
+        """Run the pipeline to completion, returning the number of records written per output"""
+        print(f"🛠️ Pipeline: {self.fetch_workers} fetch / {self.parse_workers} parse workers, "
+              f"{len(self.jobs)} views")
+
+        fetchers = self._run_stage(self._fetch_worker, self.fetch_workers, 'fetch')
+        parsers = self._run_stage(self._parse_worker, self.parse_workers, 'parse')
+        closers = [
+            threading.Thread(target=self._close_stage, args=(fetchers, self.parse_queue, self.parse_workers), daemon=True),
+            threading.Thread(target=self._close_stage, args=(parsers, self.write_queue, 1), daemon=True)
+        ]
+        for closer in closers:
+            closer.start()
+
+        self._write()
+        self._print_metrics()
+        return {target: sink.count for target, sink in self.sinks.items()}
+
+    def _write(self):
+        """Write stage: reorder parsed pages and stream them into the sinks"""
+        pending = {}
+        job, page, found = 0, 1, 0
+        while True:
+            item = self.write_queue.get()
+            if item is _DONE:
+                break
+            pending[(item[0], item[2])] = item
+
+            while (job, page) in pending:
+                started = time.perf_counter()
+                _, author_name, _, total_pages, rows = pending.pop((job, page))
+                target, _ = self.jobs[job]
+                self.sinks[target].write_rows(rows)
+                found += len(rows)
+                self.stats['write'].add(started)
+
+                if page < total_pages:
+                    page += 1
+                    continue
+                print(f"   ✅ Found {found} {target} records for {author_name}")
+                job, page, found = job + 1, 1, 0
+                with self._window_open:
+                    self._jobs_written = job
+                    self._window_open.notify_all()
+
+    def _print_metrics(self):
+        metrics = self.metrics()
+        print("📊 Pipeline stages:")
+        for name, stats in metrics['stages'].items():
+            print(f"   {name:<6} {stats['items']:>7} items   {stats['busy_seconds']:>9.1f}s busy   {stats['workers']} workers")
+        for name, depth in metrics['queues'].items():
+            print(f"   {name} queue peak depth {depth['max_depth']}/{depth['capacity']}")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+View planning for the SINTA scraping application
+
+This module decides, before any list page is requested, which views of
+an author are worth fetching. The statistics table on the profile page
+counts each author's Scopus, Google Scholar and WoS articles; a view
+counted as empty there is skipped instead of being requested only to
+come back with no items. Counts are read once per author through the
+author directory, which already fetches or caches the profile page.
+"""
+
+import threading
+from .authors import STAT_TABLE_VIEWS
+from .config import config
+
+
+class ViewPlanner:
+    """Skip views that an author's profile page counts as empty"""
+
+    def __init__(self, author_directory, max_age=None):
+        self.author_directory = author_directory
+        self.max_age = float(max_age if max_age is not None else config.get('planning.max_age', 86400))
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, author_directory):
+        """Create the planner if skipping empty views is enabled, else None"""
+        if not config.get('planning.enabled', True):
+            return None
+        return cls(author_directory)
+
+    def is_empty(self, author_id, view):
+        """Check whether the profile page counts no items for a view; unknown counts are not empty"""
+        if view not in STAT_TABLE_VIEWS.values():
+            # The statistics table has no count for this view, so don't fetch the profile page for it
+            return False
+        if self.author_directory.get_view_counts(author_id, self.max_age).get(view) != 0:
+            return False
+        with self._lock:
+            self.skipped += 1
+        return True
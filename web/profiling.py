@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Stage profiling for the SINTA scraping application
+
+In profiling mode the login, fetch, parse and write stages each get
+their own CPU profile and tracemalloc snapshot, saved next to the CSVs
+as profile-<stage>-<HHMMSS>.prof (pstats format, for snakeviz or
+python -m pstats) and profile-<stage>-<HHMMSS>.tracemalloc (load with
+tracemalloc.Snapshot.load).
+
+Up to Python 3.11, cProfile only sees the thread that enabled it, so
+every thread running a stage gets a profile of its own and a stage's
+profiles are merged when they are saved. That covers the worker pools,
+the pipeline stages and the daemon thread the web app scrapes in. From
+Python 3.12 cProfile is built on process-wide sys.monitoring: only one
+profile can be enabled at a time and it records every thread, so stages
+running concurrently cannot be told apart. There, only stage timings
+and memory snapshots are recorded in the scraper process. On any
+version, pages parsed on worker processes are profiled there and their
+stats sent back with the rows. A block that runs inside another stage
+on the same thread counts towards the outer stage.
+
+tracemalloc is process-wide, so a stage's snapshot is of the whole
+heap, taken the last time a block of that stage finished with traced
+memory at a new high.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+from .config import config
+
+
+STAGES = ('login', 'fetch', 'parse', 'write')
+
+# Whether each thread can run a cProfile profile of its own (before sys.monitoring, Python 3.12)
+PER_THREAD_PROFILES = sys.version_info < (3, 12)
+
+# A stage is snapshotted again once traced memory is this much above its last snapshot
+SNAPSHOT_GROWTH = 1.1
+
+# The active profiler, or None when profiling is off
+_profiler = None
+
+_NO_STAGE = nullcontext()
+
+
+def stage(name):
+    """Context manager that profiles a block as part of a stage while profiling is on"""
+    if _profiler is None:
+        return _NO_STAGE
+    return _profiler.stage(name)
+
+
+def staged(name):
+    """Decorator that profiles every call of a function as part of a stage"""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with _profiler.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def is_enabled():
+    """Check whether a profiler is collecting"""
+    return _profiler is not None
+
+
+def add_remote(name, stats, seconds):
+    """Add the profile stats of a block run on a worker process to a stage"""
+    if _profiler is not None and stats:
+        _profiler.stages[name].add_remote(stats, seconds)
+
+
+class _RemoteStats:
+    """Raw stats from a worker process, in the shape pstats.Stats loads"""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class StageProfile:
+    """CPU profiles, timings and memory snapshot of one stage"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.profiles = []
+        self.remote = []
+        self.snapshot = None
+        self.snapshot_memory = 0
+        self._lock = threading.Lock()
+
+    def add(self, seconds):
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+
+    def add_profile(self, profile):
+        with self._lock:
+            self.profiles.append(profile)
+
+    def add_remote(self, stats, seconds):
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+            self.remote.append(_RemoteStats(stats))
+
+    def stats(self):
+        """Merge the profiles of every thread and worker process, or None if nothing was profiled"""
+        merged = None
+        for source in self.profiles + self.remote:
+            try:
+                stats = pstats.Stats(source)
+            except TypeError:
+                # pstats refuses a profile that recorded nothing
+                continue
+            merged = stats if merged is None else merged.add(stats)
+        return merged
+
+
+class StageProfiler:
+    """Collect a CPU profile and a tracemalloc snapshot per scraping stage"""
+
+    def __init__(self, frames=None):
+        self.frames = max(1, int(frames or config.get('profiling.traceback_frames', 10)))
+        self.started_at = datetime.now()
+        self.stages = {name: StageProfile(name) for name in STAGES}
+        self._local = threading.local()
+        self._snapshot_lock = threading.Lock()
+        self._started_tracing = False
+
+    @classmethod
+    def from_config(cls):
+        """Create the profiler if profiling.enabled is set, or None"""
+        if not config.get('profiling.enabled', False):
+            return None
+        return cls()
+
+    def start(self):
+        """Start tracing allocations and make this the active profiler"""
+        global _profiler
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        if not PER_THREAD_PROFILES:
+            print("⚠️ cProfile records every thread at once on Python 3.12+, so only stage timings, "
+                  "memory snapshots and pages parsed on --parse-processes workers are profiled")
+        _profiler = self
+
+    def stop(self):
+        """Stop collecting"""
+        global _profiler
+        if _profiler is self:
+            _profiler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _thread_profile(self, stage):
+        """Get the current thread's profile for a stage"""
+        profiles = getattr(self._local, 'profiles', None)
+        if profiles is None:
+            profiles = self._local.profiles = {}
+        profile = profiles.get(stage.name)
+        if profile is None:
+            profile = profiles[stage.name] = cProfile.Profile()
+            stage.add_profile(profile)
+        return profile
+
+    @contextmanager
+    def stage(self, name):
+        """Profile a block as part of a stage"""
+        if getattr(self._local, 'active', None) is not None:
+            # Already inside a stage on this thread
+            yield
+            return
+
+        stage = self.stages[name]
+        profile = self._thread_profile(stage) if PER_THREAD_PROFILES else None
+        if profile is not None:
+            profile.enable()
+        self._local.active = name
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            self._local.active = None
+            stage.add(time.perf_counter() - started)
+            self._snapshot(stage)
+
+    def _snapshot(self, stage):
+        """Snapshot the heap if traced memory is at a new high for this stage"""
+        if not tracemalloc.is_tracing():
+            return
+        current, _ = tracemalloc.get_traced_memory()
+        if current <= stage.snapshot_memory * SNAPSHOT_GROWTH:
+            return
+        with self._snapshot_lock:
+            if current <= stage.snapshot_memory * SNAPSHOT_GROWTH:
+                return
+            stage.snapshot = tracemalloc.take_snapshot()
+            stage.snapshot_memory = current
+
+    def filename(self, name, extension):
+        return f"profile-{name}-{self.started_at.strftime('%H%M%S')}.{extension}"
+
+    def save(self, get_path):
+        """Write each stage's .prof and .tracemalloc files, returning their paths
+
+        get_path maps a file name to its path in the output directory.
+        """
+        paths = []
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+        print("🔬 Stage profiles:")
+        for stage in self.stages.values():
+            if not stage.calls:
+                continue
+            stats = stage.stats()
+            if stats is not None:
+                path = get_path(self.filename(stage.name, 'prof'))
+                stats.dump_stats(path)
+                paths.append(path)
+            if stage.snapshot is not None:
+                path = get_path(self.filename(stage.name, 'tracemalloc'))
+                stage.snapshot.dump(path)
+                paths.append(path)
+            print(f"   {stage.name:<6} {stage.calls:>7} calls   {stage.seconds:>9.1f}s   "
+                  f"{stage.snapshot_memory / 1048576:>7.1f} MB at snapshot")
+        if peak:
+            print(f"   peak traced memory {peak / 1048576:.1f} MB")
+        return paths
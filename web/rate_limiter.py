@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Rate limiting for SINTA requests
+
+This module provides a thread-safe token bucket shared by every fetch
+worker, so the combined request rate stays under the configured ceiling.
+"""
+
+import threading
+import time
+from .config import config
+
+
+class TokenBucket:
+    """Thread-safe token bucket with a burst allowance"""
+
+    def __init__(self, rate, burst=1):
+        """Allow `rate` requests per second on average and up to `burst` at once"""
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        """Create a bucket from scraping.request_delay and scraping.burst"""
+        delay = float(config.get('scraping.request_delay', 1) or 0)
+        burst = config.get('scraping.burst', 1)
+        rate = 1.0 / delay if delay > 0 else 0
+        return cls(rate, burst)
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Taking a token we don't have yet reserves the next free slot
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Fixture recording for the SINTA scraping application
+
+In record mode every profile page the fetch engine returns, whether
+fresh or from the response cache, is also saved as raw HTML under a
+fixtures directory, named <view>_<author>_<page>.html. The files can be
+checked into web/fixtures/ and replayed by the offline parser benchmark
+suite (python -m web.benchmark suite).
+"""
+
+import os
+import re
+import threading
+from urllib.parse import parse_qs, urlparse
+from .config import config
+
+
+_PROFILE_PATH = re.compile(r'/authors/profile/(\d+)')
+
+
+class FixtureRecorder:
+    """Save the raw body of every fetched profile page"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.count = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        """Create the recorder for fixtures.record_dir, or None if record mode is off"""
+        directory = config.get('fixtures.record_dir')
+        if not directory:
+            return None
+        return cls(str(directory))
+
+    @staticmethod
+    def fixture_name(url):
+        """Get the fixture file name of a profile page URL, or None for other pages"""
+        parsed = urlparse(url)
+        match = _PROFILE_PATH.search(parsed.path)
+        if match is None:
+            return None
+        query = parse_qs(parsed.query)
+        view = query.get('view', ['profile'])[0]
+        page = query.get('page', ['1'])[0]
+        return f"{view}_{match.group(1)}_{page}.html"
+
+    def record(self, url, response):
+        """Save a successful profile page response"""
+        if getattr(response, 'status_code', 200) != 200:
+            return
+        name = self.fixture_name(url)
+        if name is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, name), 'wb') as f:
+            f.write(response.content)
+        with self._lock:
+            self.count += 1
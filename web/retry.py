@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Retry policy for SINTA requests
+
+This module retries failed requests with exponential backoff and full
+jitter, honouring the server's Retry-After header when it sends one. A
+Retry-After longer than scraping.max_retry_after is not waited out: the
+response is returned as it is, without further retries.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import requests
+from .config import config
+from .metrics import RETRIES, url_view
+
+
+# Status codes worth retrying: throttling and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RetryPolicy:
+    """Retry transient request failures with exponential backoff and jitter"""
+
+    def __init__(self, max_retries=3, backoff=1.0, max_backoff=60.0, max_retry_after=300.0):
+        self.max_retries = max(0, int(max_retries))
+        self.backoff = float(backoff)
+        self.max_backoff = float(max_backoff)
+        self.max_retry_after = float(max_retry_after)
+        self.retry_count = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        """Create a policy from the scraping.max_retries, backoff and Retry-After settings"""
+        return cls(
+            max_retries=config.get('scraping.max_retries', 3),
+            backoff=config.get('scraping.retry_backoff', 1.0),
+            max_backoff=config.get('scraping.retry_max_backoff', 60.0),
+            max_retry_after=config.get('scraping.max_retry_after', 300.0)
+        )
+
+    def get_retry_after(self, response):
+        """Get the Retry-After delay in seconds, or None if absent or invalid"""
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def get_delay(self, attempt, response=None):
+        """Get the delay before retry number `attempt` (0-based); a Retry-After is used in full"""
+        retry_after = self.get_retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(self.max_backoff, self.backoff * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def call(self, request_func, url=''):
+        """Call request_func, retrying timeouts, connection errors and retryable statuses"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = request_func()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.get_delay(attempt)
+                reason = str(e)
+                kind = 'timeout' if isinstance(e, requests.Timeout) else 'connection'
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return response
+                delay = self.get_delay(attempt, response)
+                if delay > self.max_retry_after:
+                    # Retrying sooner than the server asked would only be refused again
+                    print(f"   ⚠️ {url} asked to retry in {delay:.0f}s, more than the {self.max_retry_after:.0f}s allowed; "
+                          f"giving up (HTTP {response.status_code})")
+                    return response
+                reason = f"HTTP {response.status_code}"
+                kind = str(response.status_code)
+
+            with self._lock:
+                self.retry_count += 1
+            RETRIES.inc(view=url_view(url), reason=kind)
+            print(f"   🔁 Retry {attempt + 1}/{self.max_retries} for {url} in {delay:.1f}s ({reason})")
+            time.sleep(delay)
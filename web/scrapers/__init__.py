@@ -6,15 +6,38 @@ This module provides the base class for all SINTA scrapers.
 """
 
 import csv
+import heapq
+import itertools
+import time
 from abc import ABC, abstractmethod
+from ..config import config
+from ..metrics import record_parse
+from ..profiling import staged
+from ..sinks import CsvSink
+from .parser import PAGINATION_STRAINER, make_list_view_soup, make_soup
 
 
 class BaseScraper(ABC):
     """Base class for all SINTA scrapers"""
     
-    def __init__(self, session_manager):
-        """Initialize the scraper with a session manager"""
+    # CSV columns, in output order
+    fieldnames = []
+    
+    # Profile views this scraper reads → page parser method; the first is the default
+    views = {}
+    
+    # Views verified to list their items by year → 'desc' (newest first); only these stop paging early by year
+    year_order = {}
+    
+    def __init__(self, session_manager, author_directory=None):
+        """Initialize the scraper with a session manager and optional author directory"""
         self.session = session_manager
+        self.author_directory = author_directory
+        self.journal = None
+        self.parse_pool = None
+        self.item_store = None
+        self.year_range = None
+        self.view_planner = None
     
     @abstractmethod
     def scrape(self, author_id, author_name):
@@ -26,6 +49,238 @@ class BaseScraper(ABC):
         """Save scraped data to CSV file"""
         pass
     
+    def prepare_row(self, row):
+        """Convert a scraped row into the form written to CSV"""
+        return row
+    
+    def open_sink(self, filename):
+        """Open a streaming CSV sink for this scraper's rows"""
+        return CsvSink(filename, self.fieldnames, self.prepare_row)
+    
+    def get_view_url(self, author_id, view, page=1):
+        """Get the URL of one page of a profile view"""
+        base_url = config.get_profile_url(author_id)
+        return f"{base_url}?page={page}&view={view}"
+    
+    def fetch_content(self, url):
+        """Fetch the raw body of a page"""
+        response = self.session.get(url, timeout=30)
+        return response.content
+    
+    def make_soup(self, content):
+        """Parse the list items and pagination of a raw page body"""
+        return make_list_view_soup(content)
+    
+    def fetch_soup(self, url):
+        """Fetch a page and parse it"""
+        return self.make_soup(self.fetch_content(url))
+    
+    def fetch_view_page(self, author_id, view, page):
+        """Fetch the raw body of one page of a view, or None if it failed after retries"""
+        try:
+            return self.fetch_content(self.get_view_url(author_id, view, page))
+        except Exception as e:
+            print(f"   ❌ Failed to fetch {view} page {page} for ID {author_id}: {e}")
+            return None
+    
+    def parse_view_page(self, parse_func, soup, author_id, author_name, page):
+        """Run a page parser, reporting a page that fails to parse and returning None for it"""
+        try:
+            return parse_func(soup, author_id, author_name)
+        except Exception as e:
+            print(f"   ⚠️ Error parsing page {page} for {author_name}: {e}")
+            return None
+    
+    @staged('parse')
+    def parse_content(self, parse_func, content, author_id, author_name, page):
+        """Parse a raw page body into (total_pages, rows)
+        
+        rows is None if the page failed to parse, and total_pages too if
+        its page count could not be read.
+        """
+        started = time.perf_counter()
+        soup = self.make_soup(content)
+        try:
+            total_pages = self.get_pagination_total(soup)
+        except Exception as e:
+            print(f"   ⚠️ Error reading pagination of page {page} for {author_name}: {e}")
+            total_pages, rows = None, None
+        else:
+            rows = self.parse_view_page(parse_func, soup, author_id, author_name, page)
+        record_parse(self.view_of(parse_func), time.perf_counter() - started, rows)
+        return total_pages, rows
+    
+    def lists_newest_first(self, view):
+        """Check whether a view is known to list its items newest first"""
+        return self.year_order.get(view) == 'desc'
+    
+    def view_of(self, parse_func):
+        """Get the view a bound page parser reads"""
+        name = parse_func.__name__
+        return next((view for view, method in self.views.items() if method == name), name)
+    
+    def submit_parse(self, parse_func, content, author_id, author_name, page):
+        """Start parsing a raw page body, returning a function that waits for (total_pages, rows)
+        
+        With a parse pool the page is parsed in a worker process while the
+        caller keeps going; otherwise it is parsed on this thread when the
+        result is asked for.
+        """
+        if self.parse_pool is None:
+            return lambda: self.parse_content(parse_func, content, author_id, author_name, page)
+        future = self.parse_pool.submit(parse_func, content)
+        return lambda: self.parse_pool.result(future, author_id, author_name, page)
+    
+    def iter_parsed_pages(self, author_id, author_name, view, parse_func, pages, batch_size=None):
+        """Yield (page, rows) for some pages of a view, in page order
+        
+        Pages are fetched in parallel on the fetch engine's page pool, all
+        at once or batch_size pages at a time when the caller may stop
+        early. Pages that still fail after retries are reported and skipped.
+        """
+        if batch_size:
+            for start in range(0, len(pages), batch_size):
+                yield from self.iter_parsed_pages(author_id, author_name, view, parse_func, pages[start:start + batch_size])
+            return
+        
+        contents = self.session.fetcher.map_pages(
+            lambda page: self.fetch_view_page(author_id, view, page),
+            pages
+        )
+        parsed = (
+            (page, self.submit_parse(parse_func, content, author_id, author_name, page))
+            for page, content in zip(pages, contents) if content is not None
+        )
+        if self.parse_pool is not None:
+            # Hand every page to the pool as soon as it arrives so parsing overlaps fetching
+            parsed = list(parsed)
+        for page, wait in parsed:
+            yield page, wait()[1]
+    
+    def iter_view_rows(self, author_id, author_name, view, parse_func):
+        """Yield (page, total_pages, rows) for every page of a profile view
+        
+        Page 1 is both the pagination probe and the first page of items,
+        so every page is fetched exactly once. Pages already completed in
+        the job journal are replayed from it without being fetched; every
+        newly parsed page is recorded there.
+        
+        In incremental mode (an item store is set), paging stops at the
+        first page whose items were all seen on the last complete run; the
+        rest of that run's items are yielded with it, and the merged rows
+        become the view's new baseline.
+        
+        With a year range, rows outside it are dropped, and on views known
+        to list newest first paging stops at a page older than the range.
+        Views the profile page counts as empty are not requested at all.
+        """
+        if self.view_planner is not None and self.view_planner.is_empty(author_id, view):
+            print(f"   ⏭️ Skipping {view}: the profile page counts no items")
+            return
+        
+        journal = self.journal
+        total_pages = journal.get_total_pages(author_id, view) if journal else None
+        journaled = set()
+        year_range = self.year_range
+        stop_by_year = year_range is not None and year_range.since is not None and self.lists_newest_first(view)
+        baseline = self.item_store.get_rows(author_id, view) if self.item_store is not None else None
+        may_stop_early = bool(baseline) or stop_by_year
+        batch_size = self.session.fetcher.page_workers if may_stop_early else None
+        
+        if total_pages is None:
+            content = self.fetch_view_page(author_id, view, 1)
+            if content is None:
+                return
+            total_pages, rows = self.submit_parse(parse_func, content, author_id, author_name, 1)()
+            if total_pages is None:
+                # Page 1 failed, so the page count is unknown; the view stays incomplete and is not journaled
+                print(f"   ⚠️ Page count of {view} for ID {author_id} unknown; skipping the rest of the view")
+                total_pages = 1
+            parsed = itertools.chain(
+                [(1, rows)],
+                self.iter_parsed_pages(author_id, author_name, view, parse_func, range(2, total_pages + 1), batch_size)
+            )
+        else:
+            # Resume: page 1 is journaled, so only fetch the pages still missing
+            journaled = {page for page in range(1, total_pages + 1) if journal.has(author_id, view, page)}
+            missing = [page for page in range(1, total_pages + 1) if page not in journaled]
+            parsed = self.iter_parsed_pages(author_id, author_name, view, parse_func, missing, batch_size)
+        
+        known = {row.key() for row in baseline} if baseline else set()
+        merged = [] if self.item_store is not None else None
+        complete = True
+        pages_seen = 0
+        
+        replayed = ((page, journal.get_rows(author_id, view, page)) for page in sorted(journaled))
+        for page, rows in heapq.merge(replayed, parsed, key=lambda unit: unit[0]):
+            # Failed fetches never reach here and failed parses have no rows, so only good pages are journaled
+            if rows is not None and journal and page not in journaled:
+                journal.record(author_id, view, page, total_pages, rows)
+            pages_seen += 1
+            complete = complete and rows is not None and page == pages_seen
+            rows = rows or []
+            output = rows
+            stop = False
+            
+            if merged is not None:
+                merged.extend(rows)
+                if complete and rows and page < total_pages and all(row.key() in known for row in rows):
+                    seen = {row.key() for row in merged}
+                    rest = [row for row in baseline if row.key() not in seen]
+                    print(f"   ⏩ Nothing new after page {page} of {total_pages}; reusing {len(rest)} known items")
+                    merged.extend(rest)
+                    output = rows + rest
+                    stop = True
+            
+            if year_range is not None:
+                output = year_range.filter(output)
+                if stop_by_year and year_range.older_than(rows) and page < total_pages and not stop:
+                    print(f"   ⏩ Page {page} of {total_pages} is older than {year_range}; skipping the rest")
+                    stop = True
+            
+            yield page, total_pages, output
+            if stop:
+                break
+        else:
+            complete = complete and pages_seen == total_pages
+        
+        # Only an unfiltered view seen without gaps can serve as the next baseline
+        if merged is not None and complete and year_range is None:
+            self.item_store.update(author_id, view, merged)
+    
+    def probe_total_pages(self, content):
+        """Read the page count of a view from the raw body of its first page, or None if it is unreadable"""
+        try:
+            return self.get_pagination_total(make_soup(content, parse_only=PAGINATION_STRAINER))
+        except Exception as e:
+            print(f"   ⚠️ Error reading pagination: {e}")
+            return None
+    
+    def get_author_name(self, author_id):
+        """Get an author's name from the author directory, falling back to a placeholder"""
+        if self.author_directory is not None:
+            return self.author_directory.get_name(author_id)
+        return f"Author_{author_id}"
+    
+    def iter_items(self, author_id, view=None, author_name=None):
+        """Lazily yield the records of one profile view of an author, page by page
+        
+        Records are yielded as soon as their page is parsed, without
+        building a list or writing a CSV, so a caller can filter, stream
+        or stop early; pages not yet fetched when the generator is closed
+        are cancelled.
+        """
+        if view is None:
+            view = next(iter(self.views))
+        if view not in self.views:
+            raise ValueError(f"{type(self).__name__} has no view '{view}' (expected one of: {', '.join(self.views)})")
+        if author_name is None:
+            author_name = self.get_author_name(author_id)
+        
+        parse_func = getattr(self, self.views[view])
+        for _, _, rows in self.iter_view_rows(author_id, author_name, view, parse_func):
+            yield from rows
+    
     def get_pagination_total(self, soup):
         """Get total pages from pagination element"""
         pagination_elem = soup.find(class_='pagination-text')
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Year-range filtering for SINTA list views
+
+Rows outside the requested years are dropped as each page is parsed. On
+views known to list their items newest first, paging also stops at the
+first page that is entirely older than the range, since every later page
+can only be older still. Other views are read in full and only filtered.
+"""
+
+from ..config import config
+
+
+class YearRange:
+    """Inclusive range of publication years; either end may be open"""
+
+    def __init__(self, since=None, until=None):
+        self.since = since
+        self.until = until
+
+    @classmethod
+    def from_config(cls):
+        """Create the range configured in scraping.since/until, or None if neither is set"""
+        since = config.get('scraping.since')
+        until = config.get('scraping.until')
+        if since is None and until is None:
+            return None
+        return cls(int(since) if since is not None else None, int(until) if until is not None else None)
+
+    def __str__(self):
+        return f"{self.since or '…'}–{self.until or '…'}"
+
+    def contains(self, year):
+        """Check a row's year; rows without a numeric year are kept"""
+        if not isinstance(year, int):
+            return True
+        if self.since is not None and year < self.since:
+            return False
+        if self.until is not None and year > self.until:
+            return False
+        return True
+
+    def filter(self, rows):
+        """Keep the rows inside the range"""
+        return [row for row in rows if self.contains(row.get("Tahun"))]
+
+    def older_than(self, rows):
+        """Check whether a page of a newest-first view is entirely older than the range"""
+        page_years = [row.get("Tahun") for row in rows]
+        page_years = [year for year in page_years if isinstance(year, int)]
+        return self.since is not None and bool(page_years) and max(page_years) < self.since
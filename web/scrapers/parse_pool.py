@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Multi-process page parsing for SINTA scrapers
+
+BeautifulSoup parsing holds the GIL, so however many pages the fetch
+workers bring in, list views are parsed on one core. A ParsePool ships
+raw page bytes to worker processes instead. Each worker parses the page
+with the scraper's own page parser and sends back the pagination total,
+the record type and each record's value list; the parent fills in the
+author columns. Fetch and parse then scale independently.
+"""
+
+import cProfile
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .. import profiling
+from ..config import config
+from ..metrics import ITEM_PARSE_FAILURES, record_parse
+from .parser import LIST_VIEW_STRAINER, get_parser_backend, make_soup
+
+
+def parse_page_bytes(scraper_class, method, content, backend, targeted, profiled=False):
+    """Parse one raw page in a worker process
+
+    Returns (total_pages, record_type, rows, error, stats): rows are the
+    value lists of the page's records, error is the parse failure message
+    (rows is then None, and so is total_pages if the pagination could not
+    be read), and stats carries the view, parse time and
+    skipped items for the parent's metrics, plus the page's profile stats
+    when profiled.
+    """
+    started = time.perf_counter()
+    failures = ITEM_PARSE_FAILURES.total()
+    profile = cProfile.Profile() if profiled else None
+    if profile is not None:
+        profile.enable()
+    scraper = scraper_class(None)
+    parse_func = getattr(scraper, method)
+    soup = make_soup(content, backend, LIST_VIEW_STRAINER if targeted else None)
+    total_pages = None
+    try:
+        total_pages = scraper.get_pagination_total(soup)
+        records = parse_func(soup, None, None)
+    except Exception as e:
+        records, error = None, str(e)
+    else:
+        error = None
+    if profile is not None:
+        profile.disable()
+        profile.create_stats()
+
+    stats = {
+        'view': scraper.view_of(parse_func),
+        'seconds': time.perf_counter() - started,
+        'item_failures': ITEM_PARSE_FAILURES.total() - failures,
+        'profile': profile.stats if profile is not None else None
+    }
+    if records is None:
+        return total_pages, None, None, error, stats
+    record_type = type(records[0]) if records else None
+    return total_pages, record_type, [record.data for record in records], None, stats
+
+
+def get_start_context():
+    """Get a multiprocessing context that does not fork the running scraper
+
+    By the time the first page is submitted the fetch pools are running and
+    taking the metrics locks; a forked worker could inherit one held and
+    deadlock, so workers are started from a clean forkserver (or spawned
+    where there is none). As with any spawned workers, a script that
+    parses on a pool must guard its entry point with
+    if __name__ == '__main__'.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def expand_rows(record_type, rows, author_id, author_name):
+    """Turn value lists from a worker back into records of one author"""
+    records = []
+    for data in rows:
+        record = record_type(data, coerce=False)
+        record["ID Sinta"] = author_id
+        record["Nama Sinta"] = author_name
+        records.append(record)
+    return records
+
+
+class ParsePool:
+    """Parse list-view pages in worker processes"""
+
+    def __init__(self, processes):
+        self.processes = max(1, int(processes))
+        self.executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=get_start_context())
+
+    @classmethod
+    def from_config(cls):
+        """Create the pool configured in scraping.parse_processes, or None when parsing stays in-process"""
+        processes = int(config.get('scraping.parse_processes', 0) or 0)
+        if processes <= 0:
+            return None
+        return cls(processes)
+
+    def submit(self, parse_func, content):
+        """Start parsing a raw page body with a scraper's bound page parser, returning a future"""
+        scraper = parse_func.__self__
+        return self.executor.submit(
+            parse_page_bytes,
+            type(scraper),
+            parse_func.__name__,
+            content,
+            get_parser_backend(),
+            bool(config.get('scraping.targeted_parse', True)),
+            profiling.is_enabled()
+        )
+
+    def result(self, future, author_id, author_name, page):
+        """Wait for a submitted page, returning (total_pages, rows)
+
+        rows is None if parsing failed, and total_pages too if the page
+        count could not be read.
+        """
+        try:
+            total_pages, record_type, rows, error, stats = future.result()
+        except Exception as e:
+            print(f"   ⚠️ Error parsing page {page} for {author_name}: {e}")
+            return None, None
+        record_parse(stats['view'], stats['seconds'], rows)
+        profiling.add_remote('parse', stats['profile'], stats['seconds'])
+        if stats['item_failures']:
+            ITEM_PARSE_FAILURES.inc(stats['item_failures'], view=stats['view'])
+        if error is not None:
+            print(f"   ⚠️ Error parsing page {page} for {author_name}: {error}")
+            return total_pages, None
+        return total_pages, expand_rows(record_type, rows, author_id, author_name)
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self.executor.shutdown(wait=True)
@@ -5,15 +5,74 @@ Publication data scraper for SINTA
 This module handles scraping of publication data (Scopus, Google Scholar, Web of Science) from SINTA profiles.
 """
 
-import csv
 import re
-from bs4 import BeautifulSoup
 from . import BaseScraper
+from .records import ScopusRecord, GoogleScholarRecord, WosRecord
+from .fields import ItemSchema, Field, First, All, Label, text, stripped, after_colon
+from ..sinks import CsvSink
+
+
+def wos_author_order(element):
+    """Get (author order, total authors) from an 'Author Order' tag"""
+    urutan_penulis, total_penulis = map(int, re.findall(r'\d+', element.text))
+    return urutan_penulis, total_penulis
+
+
+def wos_authors(meta_links):
+    """Get the author list from the first 'Authors :' link of the metadata"""
+    for tag in meta_links:
+        if re.search(r'Authors\s*:', tag.text):
+            return tag.text.split(':')[-1].strip()
+    return None
+
+
+SCOPUS_SCHEMA = ItemSchema('Scopus', [
+    Field("Judul Artikel", First(cls='ar-title'), stripped),
+    Field("Nama Jurnal", First(cls='ar-pub'), stripped),
+    Field("Quartile", First(cls='ar-quartile'), stripped),
+    Field("Penulis", Label(lambda text: text and 'Creator :' in text),
+          lambda e: e.parent.text.split(':')[-1].strip() if e else None),
+    Field("Tahun", First(cls='ar-year'), lambda e: e.text.strip().split()[-1]),
+    Field("Sitasi", First(cls='ar-cited'), stripped),
+    Field("Link", First(cls='ar-pub'), lambda e: e['href'])
+], ScopusRecord, view='scopus')
+
+GOOGLE_SCHOLAR_SCHEMA = ItemSchema('Google Scholar', [
+    Field("Judul Artikel", First('div', 'ar-title'), stripped),
+    Field("Nama Jurnal", First('a', 'ar-pub', within=First('div', 'ar-meta')), text),
+    Field("Penulis", Label(re.compile(r'Authors')), after_colon),
+    Field("Tahun", First('a', 'ar-year'), lambda e: e.text.strip().split()[-1]),
+    Field("Sitasi", First('a', 'ar-cited'), lambda e: e.text.strip().split()[0]),
+    Field("Link", First('a', within=First('div', 'ar-title')), lambda e: e['href'])
+], GoogleScholarRecord, view='googlescholar')
+
+WOS_SCHEMA = ItemSchema('WoS', [
+    Field("Judul Artikel", First('div', 'ar-title'), stripped),
+    Field("Nama Jurnal", First('a', 'ar-pub', within=First('div', 'ar-meta'), nth=-1), stripped),
+    Field("Quartile", First('a', 'ar-quartile'), lambda e: e.text.strip() if e else "N/A"),
+    Field("Edition", First('a', 'ar-pub'), stripped),
+    Field("Link Jurnal", First('a', 'ar-pub', within=First('div', 'ar-meta'), nth=-1), lambda e: e['href']),
+    Field("Penulis", All('a', within=First('div', 'ar-meta')), wos_authors),
+    Field(("Urutan Penulis", "Total Penulis"), Label(re.compile(r'Author Order')), wos_author_order),
+    Field("Tahun", First('a', 'ar-year'), lambda e: e.text.strip().split()[-1]),
+    Field("Sitasi", First('a', 'ar-cited'), lambda e: e.text.strip().split()[-2]),
+    Field("Terindex Scopus", First('span', 'scopus-indexed'), lambda e: "Yes" if e else "No"),
+    Field("DOI", First('a', 'ar-sinta'), lambda e: e.text.strip().split(':')[-1] if e else "N/A"),
+    Field("Link", First('a', within=First('div', 'ar-title')), lambda e: e['href'])
+], WosRecord, view='wos')
 
 
 class PublicationScraper(BaseScraper):
     """Scraper for publication data (Scopus, Google Scholar, Web of Science)"""
     
+    fieldnames_by_type = {
+        "scopus": list(ScopusRecord.columns),
+        "gs": list(GoogleScholarRecord.columns),
+        "wos": list(WosRecord.columns)
+    }
+    
+    views = {'scopus': 'parse_scopus_page', 'googlescholar': 'parse_google_scholar_page', 'wos': 'parse_wos_page'}
+    
     def scrape(self, author_id, author_name, publication_type='all'):
         """Scrape publication data for a specific author"""
         if publication_type == 'scopus':
@@ -30,188 +89,68 @@ class PublicationScraper(BaseScraper):
             results['wos'] = self.scrape_wos(author_id, author_name)
             return results
     
-    def scrape_scopus(self, author_id, author_name):
-        """Scrape Scopus publications"""
-        base_url = f"https://sinta.kemdikbud.go.id/authors/profile/{author_id}"
-        url = f"{base_url}?page=1&view=scopus"
-        response = self.session.session.get(url, timeout=30)
-        soup = BeautifulSoup(response.content, "html.parser")
+    def get_pagination_total(self, soup):
+        """Get total pages from the publication pagination element"""
         pagination_elem = soup.find(class_='pagination-text')
-        all_results = []
-
         if pagination_elem:
             pagination_text = pagination_elem.text.strip()
             page_info = pagination_text.split('|')[0].strip()
-            total_pages = int(page_info.split()[-1])
-        else:
-            total_pages = 1
-
-        print(f"   📚 Scopus Total Pages: {total_pages}")
+            return int(page_info.split()[-1])
+        return 1
+    
+    def scrape_scopus(self, author_id, author_name):
+        """Scrape Scopus publications"""
+        all_results = []
 
-        for page in range(1, total_pages + 1):
+        for page, total_pages, rows in self.iter_view_rows(author_id, author_name, 'scopus', self.parse_scopus_page):
+            if page == 1:
+                print(f"   📚 Scopus Total Pages: {total_pages}")
             print(f"   📚 Processing Scopus page {page} of {total_pages}")
-            url = f"{base_url}?page={page}&view=scopus"
-            response = self.session.session.get(url, timeout=30)
-            soup = BeautifulSoup(response.content, "html.parser")
-            items = soup.find_all(class_='ar-list-item')
-
-            for item in items:
-                try:
-                    judul = item.find(class_='ar-title').text.strip()
-                    link = item.find(class_='ar-pub')['href']
-                    journal = item.find(class_='ar-pub').text.strip()
-                    quartile = item.find(class_='ar-quartile').text.strip()
-                    creator_elem = item.find('a', string=lambda text: text and 'Creator :' in text)
-                    penulis = creator_elem.parent.text.split(':')[-1].strip() if creator_elem else None
-                    tahun = item.find(class_='ar-year').text.strip().split()[-1]
-                    sitasi = item.find(class_='ar-cited').text.strip()
-
-                    all_results.append({
-                        "Judul Artikel": judul,
-                        "Nama Jurnal": journal,
-                        "Quartile": quartile,
-                        "Penulis": penulis,
-                        "Tahun": tahun,
-                        "Sitasi": sitasi,
-                        "Link": link,
-                        "ID Sinta": author_id,
-                        "Nama Sinta": author_name
-                    })
-                except Exception as e:
-                    print(f"   ⚠️ Error processing Scopus item: {e}")
-                    continue
+            all_results.extend(rows)
 
         return all_results
     
+    def parse_scopus_page(self, soup, author_id, author_name):
+        """Parse Scopus items from a single page"""
+        return SCOPUS_SCHEMA.parse_items(soup, author_id, author_name)
+    
     def scrape_google_scholar(self, author_id, author_name):
         """Scrape Google Scholar publications"""
-        base_url = f"https://sinta.kemdikbud.go.id/authors/profile/{author_id}"
-        url = f"{base_url}?page=1&view=googlescholar"
-        response = self.session.session.get(url, timeout=30)
-        soup = BeautifulSoup(response.content, "html.parser")
-        pagination_elem = soup.find(class_='pagination-text')
         all_results = []
 
-        if pagination_elem:
-            pagination_text = pagination_elem.text.strip()
-            page_info = pagination_text.split('|')[0].strip()
-            total_pages = int(page_info.split()[-1])
-        else:
-            total_pages = 1
-
-        print(f"   🎓 Google Scholar Total Pages: {total_pages}")
-
-        for page in range(1, total_pages + 1):
+        for page, total_pages, rows in self.iter_view_rows(author_id, author_name, 'googlescholar', self.parse_google_scholar_page):
+            if page == 1:
+                print(f"   🎓 Google Scholar Total Pages: {total_pages}")
             print(f"   🎓 Processing Google Scholar page {page} of {total_pages}")
-            url = f"{base_url}?page={page}&view=googlescholar"
-            response = self.session.session.get(url, timeout=30)
-            soup = BeautifulSoup(response.content, "html.parser")
-            items = soup.find_all(class_='ar-list-item')
-
-            for item in items:
-                try:
-                    judul = item.find('div', class_='ar-title').text.strip()
-                    link = item.find('div', class_='ar-title').a['href']
-                    jurnal = item.find('div', class_='ar-meta').find('a', class_='ar-pub').text
-                    penulis = item.find('a', string=re.compile(r'Authors')).text.split(':')[-1].strip()
-                    tahun = item.find('a', class_='ar-year').text.strip().split()[-1]
-                    sitasi = item.find('a', class_='ar-cited').text.strip().split()[0]
-
-                    all_results.append({
-                        "Judul Artikel": judul,
-                        "Nama Jurnal": jurnal,
-                        "Penulis": penulis,
-                        "Tahun": tahun,
-                        "Sitasi": sitasi,
-                        "Link": link,
-                        "ID Sinta": author_id,
-                        "Nama Sinta": author_name
-                    })
-                except Exception as e:
-                    print(f"   ⚠️ Error processing Google Scholar item: {e}")
-                    continue
+            all_results.extend(rows)
 
         return all_results
     
+    def parse_google_scholar_page(self, soup, author_id, author_name):
+        """Parse Google Scholar items from a single page"""
+        return GOOGLE_SCHOLAR_SCHEMA.parse_items(soup, author_id, author_name)
+    
     def scrape_wos(self, author_id, author_name):
         """Scrape Web of Science publications"""
-        base_url = f"https://sinta.kemdikbud.go.id/authors/profile/{author_id}"
-        url = f"{base_url}?page=1&view=wos"
-        response = self.session.session.get(url, timeout=30)
-        soup = BeautifulSoup(response.content, "html.parser")
-        pagination_elem = soup.find(class_='pagination-text')
         all_results = []
 
-        if pagination_elem:
-            pagination_text = pagination_elem.text.strip()
-            page_info = pagination_text.split('|')[0].strip()
-            total_pages = int(page_info.split()[-1])
-        else:
-            total_pages = 1
-
-        print(f"   🔬 Web of Science Total Pages: {total_pages}")
-
-        for page in range(1, total_pages + 1):
+        for page, total_pages, rows in self.iter_view_rows(author_id, author_name, 'wos', self.parse_wos_page):
+            if page == 1:
+                print(f"   🔬 Web of Science Total Pages: {total_pages}")
             print(f"   🔬 Processing Web of Science page {page} of {total_pages}")
-            url = f"{base_url}?page={page}&view=wos"
-            response = self.session.session.get(url, timeout=30)
-            soup = BeautifulSoup(response.content, "html.parser")
-            items = soup.find_all(class_='ar-list-item')
-
-            for item in items:
-                try:
-                    link = item.find('div', class_='ar-title').a['href']
-                    judul = item.find('div', class_='ar-title').text.strip()
-                    quartile_elem = item.find('a', class_='ar-quartile')
-                    quartile = quartile_elem.text.strip() if quartile_elem else "N/A"
-                    edisi = item.find('a', class_='ar-pub').text.strip()
-                    jurnal = item.find('div', class_='ar-meta').find_all('a', class_='ar-pub')[-1].text.strip()
-                    link_jurnal = item.find('div', class_='ar-meta').find_all('a', class_='ar-pub')[-1]['href']
-                    urutan_penulis, total_penulis = map(int, re.findall(r'\d+', item.find('a', string=re.compile(r'Author Order')).text))
-                    author_tag = item.find('div', class_='ar-meta').find_all('a')
-                    penulis = None
-                    for tag in author_tag:
-                        if re.search(r'Authors\s*:', tag.text):
-                            penulis = tag.text.split(':')[-1].strip()
-                            break
-                    tahun = item.find('a', class_='ar-year').text.strip().split()[-1]
-                    sitasi = item.find('a', class_='ar-cited').text.strip().split()[-2]
-                    terindex_scopus = "Yes" if item.find('span', class_='scopus-indexed') else "No"
-                    doi_tag = item.find('a', class_='ar-sinta')
-                    doi = doi_tag.text.strip().split(':')[-1] if doi_tag else "N/A"
-
-                    all_results.append({
-                        "Judul Artikel": judul,
-                        "Nama Jurnal": jurnal,
-                        "Quartile": quartile,
-                        "Edition": edisi,
-                        "Link Jurnal": link_jurnal,
-                        "Penulis": penulis,
-                        "Urutan Penulis": urutan_penulis,
-                        "Total Penulis": total_penulis,
-                        "Tahun": tahun,
-                        "Sitasi": sitasi,
-                        "Terindex Scopus": terindex_scopus,
-                        "DOI": doi,
-                        "Link": link,
-                        "ID Sinta": author_id,
-                        "Nama Sinta": author_name
-                    })
-                except Exception as e:
-                    print(f"   ⚠️ Error processing WoS item: {e}")
-                    continue
+            all_results.extend(rows)
 
         return all_results
     
+    def parse_wos_page(self, soup, author_id, author_name):
+        """Parse Web of Science items from a single page"""
+        return WOS_SCHEMA.parse_items(soup, author_id, author_name)
+    
+    def open_sink(self, filename, publication_type):
+        """Open a streaming CSV sink for one publication type"""
+        return CsvSink(filename, self.fieldnames_by_type[publication_type], self.prepare_row)
+    
     def save_to_csv(self, data, filename, publication_type):
         """Save publication data to CSV"""
-        fieldnames = {
-            "scopus": ["Judul Artikel", "Nama Jurnal", "Quartile", "Penulis", "Tahun", "Sitasi", "Link", "ID Sinta", "Nama Sinta"],
-            "gs": ["Judul Artikel", "Nama Jurnal", "Penulis", "Tahun", "Sitasi", "Link", "ID Sinta", "Nama Sinta"],
-            "wos": ["Judul Artikel", "Nama Jurnal", "Quartile", "Edition", "Link Jurnal", "Penulis", "Urutan Penulis", "Total Penulis", "Tahun", "Sitasi", "Terindex Scopus", "DOI", "Link", "ID Sinta", "Nama Sinta"]
-        }
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames[publication_type])
-            writer.writeheader()
-            writer.writerows(data)
+        with self.open_sink(filename, publication_type) as sink:
+            sink.write_rows(data)
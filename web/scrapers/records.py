@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Compact typed records for SINTA list views
+
+Each list view has a Record subclass naming its CSV columns in output
+order. A record keeps its values in one list instead of a dict with the
+repeated column names of every row, and numeric columns (Tahun, Sitasi,
+author order) are converted to int once, when the item is parsed.
+Records still read like the dicts they replace (record["Tahun"],
+.get(), dict(record)), and CSV sinks and the job journal write their
+values directly.
+"""
+
+import re
+from collections.abc import Mapping
+
+
+_INTEGER = re.compile(r'\d+')
+
+
+def to_int(value):
+    """Convert an all-digit string to int, leaving anything else unchanged"""
+    if isinstance(value, str):
+        stripped = value.strip()
+        if _INTEGER.fullmatch(stripped):
+            return int(stripped)
+    return value
+
+
+class Record(Mapping):
+    """Fixed-column row of one list view"""
+
+    __slots__ = ('data',)
+
+    # Column names in CSV order, the columns holding integers, and the
+    # columns identifying an item across runs
+    columns = ()
+    numeric = ()
+    key_columns = ()
+
+    # Record types by class name, for reading stored rows back
+    registry = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.index = {column: i for i, column in enumerate(cls.columns)}
+        cls.numeric_index = tuple(cls.index[column] for column in cls.numeric)
+        Record.registry[cls.__name__] = cls
+
+    def __init__(self, data, coerce=True):
+        self.data = list(data)
+        if coerce:
+            for i in self.numeric_index:
+                self.data[i] = to_int(self.data[i])
+
+    @classmethod
+    def blank(cls):
+        """A record with every column empty, for filling in by position"""
+        return cls([None] * len(cls.columns), coerce=False)
+
+    def __getitem__(self, column):
+        return self.data[self.index[column]]
+
+    def __setitem__(self, column, value):
+        self.data[self.index[column]] = value
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (type(self), (self.data, False))
+
+    def key(self):
+        """Identity of the item across runs"""
+        return "|".join(str(self[column]) for column in self.key_columns)
+
+    def map(self, func):
+        """A copy of the record with func applied to every value"""
+        return type(self)([func(value) for value in self.data], coerce=False)
+
+
+class BookRecord(Record):
+    __slots__ = ()
+    columns = ("Judul Buku", "Kategori Buku", "Penulis", "Penerbit", "Tahun", "Kota", "ISBN", "ID Sinta", "Nama Sinta")
+    numeric = ("Tahun",)
+    key_columns = ("Judul Buku", "Tahun")
+
+
+class HakiRecord(Record):
+    __slots__ = ()
+    columns = ("Judul HAKI", "Penemu", "Jenis HAKI", "Nomor HAKI", "Tahun", "ID Sinta", "Nama Sinta")
+    numeric = ("Tahun",)
+    key_columns = ("Judul HAKI", "Nomor HAKI")
+
+
+class ResearchRecord(Record):
+    __slots__ = ()
+    columns = ("Judul Penelitian", "Ketua Penelitian", "Sumber Dana", "Anggota Penelitian", "Tahun", "Besar Dana", "Status", "Sumber", "ID Sinta", "Nama Sinta")
+    numeric = ("Tahun",)
+    key_columns = ("Judul Penelitian", "Tahun")
+
+
+class CommunityServiceRecord(Record):
+    __slots__ = ()
+    columns = ("Judul PPM", "Ketua PPM", "Skim PPM", "Anggota PPM", "Tahun", "Besar Dana", "Status", "Sumber", "ID Sinta", "Nama Sinta")
+    numeric = ("Tahun",)
+    key_columns = ("Judul PPM", "Tahun")
+
+
+class ScopusRecord(Record):
+    __slots__ = ()
+    columns = ("Judul Artikel", "Nama Jurnal", "Quartile", "Penulis", "Tahun", "Sitasi", "Link", "ID Sinta", "Nama Sinta")
+    numeric = ("Tahun", "Sitasi")
+    key_columns = ("Judul Artikel", "Tahun")
+
+
+class GoogleScholarRecord(Record):
+    __slots__ = ()
+    columns = ("Judul Artikel", "Nama Jurnal", "Penulis", "Tahun", "Sitasi", "Link", "ID Sinta", "Nama Sinta")
+    numeric = ("Tahun", "Sitasi")
+    key_columns = ("Link",)
+
+
+class WosRecord(Record):
+    __slots__ = ()
+    columns = ("Judul Artikel", "Nama Jurnal", "Quartile", "Edition", "Link Jurnal", "Penulis", "Urutan Penulis", "Total Penulis", "Tahun", "Sitasi", "Terindex Scopus", "DOI", "Link", "ID Sinta", "Nama Sinta")
+    numeric = ("Urutan Penulis", "Total Penulis", "Tahun", "Sitasi")
+    key_columns = ("Link",)
+
+
+def dump_rows(rows):
+    """Encode rows for JSON as (record type name, value lists), with no type name for plain dicts"""
+    if rows and isinstance(rows[0], Record):
+        return type(rows[0]).__name__, [row.data for row in rows]
+    return None, rows
+
+
+def load_rows(record_name, rows):
+    """Decode rows written by dump_rows"""
+    record_type = Record.registry.get(record_name)
+    if record_type is None:
+        return rows
+    return [record_type(data, coerce=False) for data in rows]
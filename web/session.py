@@ -12,6 +12,8 @@ from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from pathlib import Path
 from .config import config
+from .fetcher import FetchEngine
+from .profiling import staged
 
 
 class SintaRequestLogin:
@@ -109,7 +111,7 @@ class SintaRequestLogin:
                     if form_action.startswith('http'):
                         login_url = form_action
                     else:
-                        login_url = f"https://sinta.kemdikbud.go.id{form_action}"
+                        login_url = f"{config.get_base_url()}{form_action}"
                 else:
                     login_url = login_page_url
             else:
@@ -134,7 +136,7 @@ class SintaRequestLogin:
             # Update headers for POST request
             self.session.headers.update({
                 'Content-Type': 'application/x-www-form-urlencoded',
-                'Origin': 'https://sinta.kemdikbud.go.id',
+                'Origin': config.get_base_url(),
                 'Referer': login_page_url
             })
             
@@ -239,7 +241,20 @@ class SessionManager:
             'User-Agent': config.get_user_agent()
         }
         self.session.headers.update(self.headers)
+        self.fetcher = FetchEngine(self)
     
+    def clone_session(self):
+        """Create a new requests session sharing this session's headers and cookies"""
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        session.cookies.update(self.session.cookies)
+        return session
+    
+    def get(self, url, timeout=30):
+        """Perform a GET request through the fetch engine"""
+        return self.fetcher.get(url, timeout=timeout)
+    
+    @staged('login')
     def initialize_session(self, force_new_login=False):
         """Initialize SINTA session using request-based login"""
         try:
@@ -273,6 +288,7 @@ class SessionManager:
                     
                     self.cookies = session_data['cookies']
                     self.session.cookies.update(self.cookies)
+                    self.fetcher.reset_sessions()
                     
                     # Test if session is still valid
                     if self.test_session():
@@ -291,6 +307,7 @@ class SessionManager:
                 if session_data:
                     self.cookies = session_data['cookies']
                     self.session.cookies.update(self.cookies)
+                    self.fetcher.reset_sessions()
                     
                     # Save session data
                     os.makedirs(os.path.dirname(session_file), exist_ok=True)
@@ -320,7 +337,9 @@ class SessionManager:
             session_config = config.get_session_config()
             test_url = session_config['test_url']
             
-            response = self.session.get(test_url, timeout=10)
+            response = self.fetcher.retry_policy.call(
+                lambda: self.session.get(test_url, timeout=10), test_url
+            )
             
             if response.status_code == 200:
                 # Check if we're not redirected to login
@@ -377,3 +396,9 @@ class LecturerManager:
     def get_lecturers(self):
         """Get list of lecturers"""
         return self.lecturers
+    
+    def resolve_names(self, author_directory, map_func=map):
+        """Fill in lecturer names from the author directory"""
+        names = map_func(lambda lecturer: author_directory.get_name(lecturer[0]), self.lecturers)
+        self.lecturers = [(lecturer_id, name) for (lecturer_id, _), name in zip(self.lecturers, names)]
+        return self.lecturers
@@ -5,7 +5,19 @@ Main SINTA Scraping Application
 This module provides the main application class that orchestrates all scraping operations.
 """
 
+import os
 import sys
+from contextlib import ExitStack, contextmanager
+from .authors import AuthorDirectory
+from .config import config
+from .incremental import ItemStore
+from .journal import JobJournal
+from .manifest import RunManifest
+from .planner import ViewPlanner
+from .pipeline import ScrapePipeline
+from .profiling import StageProfiler
+from .scrapers.filters import YearRange
+from .scrapers.parse_pool import ParsePool
 from .session import SessionManager, LecturerManager
 from .utils import Utils
 from .scrapers.book_scraper import BookScraper
@@ -22,13 +34,19 @@ class SintaScrapingApp:
     def __init__(self):
         self.session_manager = SessionManager()
         self.lecturer_manager = LecturerManager()
+        self.author_directory = AuthorDirectory(self.session_manager)
+        self.journal = None
+        self.parse_pool = None
+        self.item_store = None
+        self.manifest = None
+        self.profiler = None
         self.scrapers = {
-            'buku': BookScraper(self.session_manager),
-            'haki': HakiScraper(self.session_manager),
-            'publikasi': PublicationScraper(self.session_manager),
-            'penelitian': ResearchScraper(self.session_manager),
-            'ppm': CommunityServiceScraper(self.session_manager),
-            'profil': ProfileScraper(self.session_manager)
+            'buku': BookScraper(self.session_manager, self.author_directory),
+            'haki': HakiScraper(self.session_manager, self.author_directory),
+            'publikasi': PublicationScraper(self.session_manager, self.author_directory),
+            'penelitian': ResearchScraper(self.session_manager, self.author_directory),
+            'ppm': CommunityServiceScraper(self.session_manager, self.author_directory),
+            'profil': ProfileScraper(self.session_manager, self.author_directory)
         }
     
     def initialize(self):
@@ -36,65 +54,178 @@ class SintaScrapingApp:
         print("🚀 SINTA Scraping Application")
         print("=" * 50)
         
+        # Profile every stage from login on if requested
+        self.profiler = StageProfiler.from_config()
+        if self.profiler:
+            self.profiler.start()
+            print("🔬 Profiling login, fetch, parse and write stages")
+        
         # Load lecturers
         if not self.lecturer_manager.load_lecturers():
             return False
         
-        # Initialize session
-        if not self.session_manager.initialize_session():
+        # Initialize session (cache-only runs never touch the network)
+        if config.get('cache.offline', False):
+            print("📦 Cache-only mode: skipping login")
+        elif not self.session_manager.initialize_session():
             return False
         
+        # Resolve lecturer names once for the whole run
+        self.resolve_lecturer_names()
+        
+        # Checkpoint completed units so an interrupted run can resume
+        self.journal = JobJournal.from_config()
+        for scraper in self.scrapers.values():
+            scraper.journal = self.journal
+        
+        # Parse list views on worker processes if configured
+        self.parse_pool = ParsePool.from_config()
+        if self.parse_pool:
+            print(f"🧮 Parsing pages on {self.parse_pool.processes} worker processes")
+        for scraper in self.scrapers.values():
+            scraper.parse_pool = self.parse_pool
+        
+        # Keep only the requested years, stopping early where a view allows it
+        year_range = YearRange.from_config()
+        if year_range:
+            print(f"📅 Year range: {year_range}")
+        for scraper in self.scrapers.values():
+            scraper.year_range = year_range
+        
+        # Skip views the profile page counts as empty
+        view_planner = ViewPlanner.from_config(self.author_directory)
+        for scraper in self.scrapers.values():
+            scraper.view_planner = view_planner
+        
+        # Stop paging at already-known items if incremental mode is on
+        self.item_store = ItemStore.from_config()
+        if self.item_store:
+            print(f"🔁 Incremental mode: known items from {self.item_store.directory}")
+        for scraper in self.scrapers.values():
+            scraper.item_store = self.item_store
+        
         # Ensure output directory exists
         Utils.ensure_output_dir()
         
         return True
     
+    def close(self):
+        """Stop the worker pools, save the incremental baseline and close the job journal"""
+        if self.parse_pool:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+        self.session_manager.fetcher.shutdown()
+        if self.item_store:
+            try:
+                self.item_store.save()
+            except OSError as e:
+                print(f"⚠️ Could not save incremental item store: {e}")
+        if self.journal:
+            self.journal.close()
+        if self.profiler:
+            self._save_profiles()
+    
+    def _save_profiles(self):
+        """Write the stage profiles next to the CSVs and stop profiling"""
+        profiler, self.profiler = self.profiler, None
+        try:
+            paths = profiler.save(Utils.get_output_path)
+            if paths:
+                print(f"🔬 Profiles saved to {os.path.dirname(paths[0])} (open .prof files with snakeviz)")
+        except OSError as e:
+            print(f"⚠️ Could not save stage profiles: {e}")
+        finally:
+            profiler.stop()
+    
+    def resolve_lecturer_names(self):
+        """Fill in lecturer names from the author directory, fetching only missing or stale profiles"""
+        print(f"🔎 Resolving names for {len(self.lecturer_manager.get_lecturers())} lecturers...")
+        self.lecturer_manager.resolve_names(self.author_directory, self.session_manager.fetcher.map)
+        self._save_author_directory()
+    
+    def _save_author_directory(self):
+        """Persist the author directory, warning instead of failing the run"""
+        try:
+            self.author_directory.save()
+        except OSError as e:
+            print(f"⚠️ Could not save author directory: {e}")
+    
+    @contextmanager
+    def _run_manifest(self, name):
+        """Collect the run manifest of a scrape call, writing it next to the CSVs when the outermost call ends"""
+        if self.manifest is not None:
+            yield self.manifest
+            return
+        
+        manifest = self.manifest = RunManifest(name, len(self.lecturer_manager.get_lecturers()))
+        status = 'failed'
+        try:
+            yield manifest
+            status = 'completed'
+        finally:
+            self.manifest = None
+            manifest.finish(status)
+            try:
+                path = manifest.save(Utils.get_output_path(manifest.filename))
+                print(f"🧾 Run manifest saved to {path}")
+            except OSError as e:
+                print(f"⚠️ Could not save run manifest: {e}")
+    
+    def _map_lecturers(self, scrape_author):
+        """Run scrape_author for every lecturer concurrently, yielding results in roster order"""
+        def process(lecturer):
+            author_id, author_name = lecturer
+            if author_name is None:
+                author_name = self.author_directory.get_name(author_id)
+            print(f"👤 Processing: {author_name} (ID: {author_id})")
+            return scrape_author(author_id, author_name)
+        
+        return self.session_manager.fetcher.imap(process, self.lecturer_manager.get_lecturers())
+    
+    def _scrape_category(self, target, scrape_author, sink):
+        """Stream every lecturer's rows into a sink as soon as they are parsed"""
+        with self._run_manifest(target) as manifest, manifest.category(target) as category, sink:
+            for results in self._map_lecturers(category.timed(scrape_author)):
+                sink.write_rows(results)
+            category.rows = sink.count
+        return sink.count
+    
     def scrape_buku(self):
-        """Scrape book data for all lecturers"""
+        """Scrape book data for all lecturers, returning the number of records saved"""
         print("\n📖 Scraping Book Data...")
         print("-" * 30)
         
         scraper = self.scrapers['buku']
-        all_results = []
         
-        for author_id, _ in self.lecturer_manager.get_lecturers():
-            # Get real author name
-            author_name = Utils.get_author_name(self.session_manager.session, author_id)
-            print(f"👤 Processing: {author_name} (ID: {author_id})")
+        def scrape_author(author_id, author_name):
             results = scraper.scrape(author_id, author_name)
-            all_results.extend(results)
-            print(f"   ✅ Found {len(results)} books")
+            print(f"   ✅ Found {len(results)} books for {author_name}")
+            return results
         
-        # Save to CSV
         csv_filename = Utils.get_output_file("buku")
-        scraper.save_to_csv(all_results, csv_filename)
-        print(f"💾 Saved {len(all_results)} book records to {csv_filename}")
-        return all_results
+        count = self._scrape_category("buku", scrape_author, scraper.open_sink(csv_filename))
+        print(f"💾 Saved {count} book records to {csv_filename}")
+        return count
     
     def scrape_haki(self):
-        """Scrape HAKI data for all lecturers"""
+        """Scrape HAKI data for all lecturers, returning the number of records saved"""
         print("\n🏛️ Scraping HAKI Data...")
         print("-" * 30)
         
         scraper = self.scrapers['haki']
-        all_results = []
         
-        for author_id, _ in self.lecturer_manager.get_lecturers():
-            # Get real author name
-            author_name = Utils.get_author_name(self.session_manager.session, author_id)
-            print(f"👤 Processing: {author_name} (ID: {author_id})")
+        def scrape_author(author_id, author_name):
             results = scraper.scrape(author_id, author_name)
-            all_results.extend(results)
-            print(f"   ✅ Found {len(results)} HAKI records")
+            print(f"   ✅ Found {len(results)} HAKI records for {author_name}")
+            return results
         
-        # Save to CSV
         csv_filename = Utils.get_output_file("haki")
-        scraper.save_to_csv(all_results, csv_filename)
-        print(f"💾 Saved {len(all_results)} HAKI records to {csv_filename}")
-        return all_results
+        count = self._scrape_category("haki", scrape_author, scraper.open_sink(csv_filename))
+        print(f"💾 Saved {count} HAKI records to {csv_filename}")
+        return count
     
     def scrape_publikasi(self, publication_types=None):
-        """Scrape publication data for all lecturers"""
+        """Scrape publication data for all lecturers, returning record counts per type"""
         if publication_types is None:
             publication_types = ['scopus', 'gs', 'wos']
         
@@ -102,114 +233,218 @@ class SintaScrapingApp:
         print("-" * 50)
         
         scraper = self.scrapers['publikasi']
-        results_by_type = {}
+        counts_by_type = {}
         
-        for pub_type in publication_types:
-            print(f"\n📊 Processing {pub_type.upper()} publications...")
-            all_results = []
-            
-            for author_id, _ in self.lecturer_manager.get_lecturers():
-                # Get real author name
-                author_name = Utils.get_author_name(self.session_manager.session, author_id)
-                print(f"👤 Processing: {author_name} (ID: {author_id})")
+        with self._run_manifest('publikasi'):
+            for pub_type in publication_types:
+                print(f"\n📊 Processing {pub_type.upper()} publications...")
                 
-                if pub_type == 'scopus':
-                    results = scraper.scrape_scopus(author_id, author_name)
-                elif pub_type == 'gs':
-                    results = scraper.scrape_google_scholar(author_id, author_name)
-                elif pub_type == 'wos':
-                    results = scraper.scrape_wos(author_id, author_name)
+                def scrape_author(author_id, author_name, pub_type=pub_type):
+                    results = scraper.scrape(author_id, author_name, pub_type)
+                    print(f"   ✅ Found {len(results)} {pub_type.upper()} publications for {author_name}")
+                    return results
                 
-                all_results.extend(results)
-                print(f"   ✅ Found {len(results)} {pub_type.upper()} publications")
-            
-            # Save to CSV
-            csv_filename = Utils.get_output_file(f"publikasi_{pub_type}")
-            scraper.save_to_csv(all_results, csv_filename, pub_type)
-            print(f"💾 Saved {len(all_results)} {pub_type.upper()} records to {csv_filename}")
-            results_by_type[pub_type] = all_results
+                csv_filename = Utils.get_output_file(f"publikasi_{pub_type}")
+                count = self._scrape_category(f"publikasi_{pub_type}", scrape_author, scraper.open_sink(csv_filename, pub_type))
+                print(f"💾 Saved {count} {pub_type.upper()} records to {csv_filename}")
+                counts_by_type[pub_type] = count
         
-        return results_by_type
+        return counts_by_type
     
     def scrape_penelitian(self):
-        """Scrape research data for all lecturers"""
+        """Scrape research data for all lecturers, returning the number of records saved"""
         print("\n🔬 Scraping Research Data...")
         print("-" * 30)
         
         scraper = self.scrapers['penelitian']
-        all_results = []
         
-        for author_id, _ in self.lecturer_manager.get_lecturers():
-            # Get real author name
-            author_name = Utils.get_author_name(self.session_manager.session, author_id)
-            print(f"👤 Processing: {author_name} (ID: {author_id})")
+        def scrape_author(author_id, author_name):
             results = scraper.scrape(author_id, author_name)
-            all_results.extend(results)
-            print(f"   ✅ Found {len(results)} research records")
+            print(f"   ✅ Found {len(results)} research records for {author_name}")
+            return results
         
-        # Save to CSV
         csv_filename = Utils.get_output_file("penelitian")
-        scraper.save_to_csv(all_results, csv_filename)
-        print(f"💾 Saved {len(all_results)} research records to {csv_filename}")
-        return all_results
+        count = self._scrape_category("penelitian", scrape_author, scraper.open_sink(csv_filename))
+        print(f"💾 Saved {count} research records to {csv_filename}")
+        return count
     
     def scrape_ppm(self):
-        """Scrape community service data for all lecturers"""
+        """Scrape community service data for all lecturers, returning the number of records saved"""
         print("\n🤝 Scraping Community Service Data...")
         print("-" * 40)
         
         scraper = self.scrapers['ppm']
-        all_results = []
         
-        for author_id, _ in self.lecturer_manager.get_lecturers():
-            # Get real author name
-            author_name = Utils.get_author_name(self.session_manager.session, author_id)
-            print(f"👤 Processing: {author_name} (ID: {author_id})")
+        def scrape_author(author_id, author_name):
             results = scraper.scrape(author_id, author_name)
-            all_results.extend(results)
-            print(f"   ✅ Found {len(results)} community service records")
+            print(f"   ✅ Found {len(results)} community service records for {author_name}")
+            return results
         
-        # Save to CSV
         csv_filename = Utils.get_output_file("ppm")
-        scraper.save_to_csv(all_results, csv_filename)
-        print(f"💾 Saved {len(all_results)} community service records to {csv_filename}")
-        return all_results
+        count = self._scrape_category("ppm", scrape_author, scraper.open_sink(csv_filename))
+        print(f"💾 Saved {count} community service records to {csv_filename}")
+        return count
     
     def scrape_profil(self):
-        """Scrape profile data for all lecturers"""
+        """Scrape profile data for all lecturers, returning the number of records saved"""
         print("\n👤 Scraping Profile Data...")
         print("-" * 30)
         
         scraper = self.scrapers['profil']
-        all_results = []
         
-        for author_id, _ in self.lecturer_manager.get_lecturers():
-            # Get real author name
-            author_name = Utils.get_author_name(self.session_manager.session, author_id)
-            print(f"👤 Processing: {author_name} (ID: {author_id})")
+        def scrape_author(author_id, author_name):
             result = scraper.scrape(author_id, author_name)
-            all_results.append(result)
-            print(f"   ✅ Profile data collected")
+            print(f"   ✅ Profile data collected for {author_name}")
+            return [result]
         
-        # Save to CSV
         csv_filename = Utils.get_output_file("profil")
-        scraper.save_to_csv(all_results, csv_filename)
-        print(f"💾 Saved {len(all_results)} profile records to {csv_filename}")
-        return all_results
+        count = self._scrape_category("profil", scrape_author, scraper.open_sink(csv_filename))
+        self._save_author_directory()
+        print(f"💾 Saved {count} profile records to {csv_filename}")
+        return count
     
-    def scrape_all(self):
-        """Scrape all categories for all lecturers"""
+    def _get_targets(self):
+        """Map each output CSV to a function scraping one author's rows for it"""
+        publikasi = self.scrapers['publikasi']
+        profil = self.scrapers['profil']
+        return {
+            'buku': self.scrapers['buku'].scrape,
+            'haki': self.scrapers['haki'].scrape,
+            'publikasi_scopus': lambda author_id, author_name: publikasi.scrape(author_id, author_name, 'scopus'),
+            'publikasi_gs': lambda author_id, author_name: publikasi.scrape(author_id, author_name, 'gs'),
+            'publikasi_wos': lambda author_id, author_name: publikasi.scrape(author_id, author_name, 'wos'),
+            'penelitian': self.scrapers['penelitian'].scrape,
+            'ppm': self.scrapers['ppm'].scrape,
+            'profil': lambda author_id, author_name: [profil.scrape(author_id, author_name)]
+        }
+    
+    def _open_target_sink(self, target):
+        """Open the streaming CSV sink of one output"""
+        csv_filename = Utils.get_output_file(target)
+        if target.startswith('publikasi_'):
+            return self.scrapers['publikasi'].open_sink(csv_filename, target.split('_', 1)[1])
+        return self.scrapers[target].open_sink(csv_filename)
+    
+    def scrape_author_major(self, targets=None):
+        """Scrape every requested output for one author as a unit, overlapping the views
+        
+        Returns the number of records saved per output.
+        """
+        scrape_funcs = self._get_targets()
+        if targets is None:
+            targets = list(scrape_funcs)
+        
+        print(f"\n🧑‍🔬 Author-major scraping: {', '.join(targets)}")
+        print("-" * 50)
+        
+        with self._run_manifest('author_major') as manifest, ExitStack() as stack:
+            # Every output is in progress for the whole call, so all share its wall time
+            categories = {target: stack.enter_context(manifest.category(target)) for target in targets}
+            timed_funcs = {target: categories[target].timed(scrape_funcs[target]) for target in targets}
+            
+            def scrape_author(author_id, author_name):
+                rows_by_target = self.session_manager.fetcher.map_views(
+                    lambda target: timed_funcs[target](author_id, author_name), targets
+                )
+                print(f"   ✅ Collected {sum(len(rows) for rows in rows_by_target)} records for {author_name}")
+                return rows_by_target
+            
+            sinks = {target: self._open_target_sink(target) for target in targets}
+            try:
+                for rows_by_target in self._map_lecturers(scrape_author):
+                    for target, rows in zip(targets, rows_by_target):
+                        sinks[target].write_rows(rows)
+            finally:
+                for target, sink in sinks.items():
+                    sink.close()
+                    categories[target].rows = sink.count
+        
+        for target, sink in sinks.items():
+            print(f"💾 Saved {sink.count} {target} records to {sink.filename}")
+        if 'profil' in targets:
+            self._save_author_directory()
+        return {target: sink.count for target, sink in sinks.items()}
+    
+    def _get_view_targets(self):
+        """Map each list-view output CSV to its (scraper, view, page parser)"""
+        publikasi = self.scrapers['publikasi']
+        return {
+            'buku': (self.scrapers['buku'], 'books', self.scrapers['buku'].parse_page),
+            'haki': (self.scrapers['haki'], 'iprs', self.scrapers['haki'].parse_page),
+            'publikasi_scopus': (publikasi, 'scopus', publikasi.parse_scopus_page),
+            'publikasi_gs': (publikasi, 'googlescholar', publikasi.parse_google_scholar_page),
+            'publikasi_wos': (publikasi, 'wos', publikasi.parse_wos_page),
+            'penelitian': (self.scrapers['penelitian'], 'researches', self.scrapers['penelitian'].parse_page),
+            'ppm': (self.scrapers['ppm'], 'services', self.scrapers['ppm'].parse_page)
+        }
+    
+    def scrape_pipeline(self, targets=None):
+        """Scrape list-view outputs through the staged fetch → parse → write pipeline
+        
+        Returns the number of records saved per output.
+        """
+        views = self._get_view_targets()
+        if targets is not None:
+            views = {target: views[target] for target in targets}
+        
+        print(f"\n🛠️ Pipeline scraping: {', '.join(views)}")
+        print("-" * 50)
+        
+        with self._run_manifest('pipeline') as manifest, ExitStack() as stack:
+            # Stages interleave authors and outputs, so only per-output totals are recorded
+            categories = {target: stack.enter_context(manifest.category(target)) for target in views}
+            sinks = {target: self._open_target_sink(target) for target in views}
+            try:
+                pipeline = ScrapePipeline(views, sinks, self.lecturer_manager.get_lecturers(), self.author_directory)
+                counts = pipeline.run()
+            finally:
+                for target, sink in sinks.items():
+                    sink.close()
+                    categories[target].rows = sink.count
+        
+        for target, sink in sinks.items():
+            print(f"💾 Saved {sink.count} {target} records to {sink.filename}")
+        return counts
+    
+    def scrape_all(self, author_major=None, pipeline=None):
+        """Scrape all categories for all lecturers, returning record counts per category"""
         print("\n🎯 Scraping ALL Categories...")
         print("=" * 50)
         
-        results = {}
-        results['buku'] = self.scrape_buku()
-        results['haki'] = self.scrape_haki()
-        results['publikasi'] = self.scrape_publikasi()
-        results['penelitian'] = self.scrape_penelitian()
-        results['ppm'] = self.scrape_ppm()
-        results['profil'] = self.scrape_profil()
+        if author_major is None:
+            author_major = bool(config.get('scraping.author_major', False))
+        if pipeline is None:
+            pipeline = bool(config.get('pipeline.enabled', False))
+        
+        with self._run_manifest('all') as manifest:
+            manifest.mode = 'pipeline' if pipeline else 'author_major' if author_major else 'category'
+            results = self._scrape_all(author_major, pipeline)
         
         print("\n✅ All scraping completed successfully!")
         print(f"📁 Results saved in: {Utils.get_output_dir()}")
         return results
+    
+    def _scrape_all(self, author_major, pipeline):
+        """Scrape every category with the chosen scheduling"""
+        results = {}
+        if pipeline:
+            for target, count in self.scrape_pipeline().items():
+                if target.startswith('publikasi_'):
+                    results.setdefault('publikasi', {})[target.split('_', 1)[1]] = count
+                else:
+                    results[target] = count
+            results['profil'] = self.scrape_profil()
+        elif author_major:
+            for target, count in self.scrape_author_major().items():
+                if target.startswith('publikasi_'):
+                    results.setdefault('publikasi', {})[target.split('_', 1)[1]] = count
+                else:
+                    results[target] = count
+        else:
+            results['buku'] = self.scrape_buku()
+            results['haki'] = self.scrape_haki()
+            results['publikasi'] = self.scrape_publikasi()
+            results['penelitian'] = self.scrape_penelitian()
+            results['ppm'] = self.scrape_ppm()
+            results['profil'] = self.scrape_profil()
+        return results
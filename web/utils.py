@@ -8,7 +8,6 @@ This module provides common utility functions used across the application.
 import os
 from datetime import datetime
 from pathlib import Path
-from bs4 import BeautifulSoup
 from .config import config
 
 
@@ -50,31 +49,15 @@ class Utils:
     @staticmethod
     def get_output_file(filename_base):
         """Get full output file path"""
+        return Utils.get_output_path(f"{filename_base}.csv")
+    
+    @staticmethod
+    def get_output_path(filename):
+        """Get the full path of a file in the output directory"""
         # Get project root directory (parent of web directory)
         current_dir = Path(__file__).parent  # web directory
         project_root = current_dir.parent    # project root
         
         output_dir_name = Utils.get_output_dir()
         output_dir = project_root / output_dir_name
-        filename = f"{filename_base}.csv"
         return str(output_dir / filename)
-    
-    @staticmethod
-    def get_author_name(session, author_id):
-        """Get real author name from SINTA profile"""
-        try:
-            url = f"https://sinta.kemdikbud.go.id/authors/profile/{author_id}"
-            response = session.get(url, timeout=30)
-            soup = BeautifulSoup(response.content, "html.parser")
-            
-            # Extract name from profile
-            profile_section = soup.find('div', class_='col-lg col-md')
-            if profile_section:
-                name_element = profile_section.find('h3').find('a')
-                if name_element:
-                    return name_element.text.strip()
-            
-            return f"Author_{author_id}"
-        except Exception as e:
-            print(f"   ⚠️ Error getting author name for ID {author_id}: {e}")
-            return f"Author_{author_id}"